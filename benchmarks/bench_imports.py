@@ -0,0 +1,109 @@
+#Cold-start import cost of Home.py and each page, checked against a per-page budget.
+#Each script's module-level imports are replayed in a fresh interpreter, so the
+#numbers are what the first request after a process start waits on before the page
+#draws anything. Run from the repository root:
+#    python benchmarks/bench_imports.py --repeat 5
+import argparse
+import ast
+import itertools
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT = os.path.join(ROOT, "project")
+
+#Seconds of module-level imports allowed per script, streamlit itself included
+IMPORT_BUDGETS = {
+    "Home": 1.5,
+    "Air Temperature": 1.5,
+    "Relative Humidity": 1.5,
+    "Wind": 1.5,
+    "Precipitation": 1.5,
+    "Live Conditions": 1.5,
+    "Date Range": 1.5,
+    "Climatology": 2.0,
+    "Correlation": 2.0,
+}
+
+#Packages that must not be imported before a page renders its first panel, beyond what
+#`import streamlit` loads by itself (it imports plotly to register its chart theme)
+DEFERRED = ("matplotlib", "plotly", "seaborn")
+
+BASELINE = "import streamlit as st"
+
+
+def script_path(page):
+    if page == "Home":
+        return os.path.join(PROJECT, "Home.py")
+    return os.path.join(PROJECT, "pages", f"{page}.py")
+
+
+#Source of the import block heading a script; imports further down, next to the panel
+#that needs them, run only once the page has started drawing and are left out
+def module_imports(path):
+    with open(path, encoding="utf-8") as file:
+        source = file.read()
+    statements = itertools.takewhile(lambda node: isinstance(node, (ast.Import, ast.ImportFrom)), ast.parse(source).body)
+    return "\n".join(ast.get_source_segment(source, node) for node in statements)
+
+
+#Wall time of the imports plus the per-package cumulative times from -X importtime
+def time_imports(imports):
+    code = "import time\nstart = time.perf_counter()\n" + imports + "\nprint(time.perf_counter() - start)\n"
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True,
+                               text=True, env={**os.environ, "PYTHONPATH": PROJECT}, check=True)
+    packages = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            packages[name.strip()] = int(cumulative) / 1e6
+    return float(completed.stdout.split()[-1]), packages
+
+
+def bench_script(page, repeat, baseline):
+    imports = module_imports(script_path(page))
+    runs = [time_imports(imports) for _ in range(repeat)]
+    seconds, packages = min(runs, key=lambda run: run[0])
+    roots = {name: value for name, value in packages.items() if "." not in name}
+    deferred = sorted(name for name in packages if name.startswith(DEFERRED) and name not in baseline)
+    return {
+        "page": page,
+        "seconds": seconds,
+        "budget": IMPORT_BUDGETS[page],
+        "heaviest": sorted(roots.items(), key=lambda item: item[1], reverse=True)[:5],
+        "deferred_imported": deferred,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold-start imports of the dashboard scripts.")
+    parser.add_argument("--pages", nargs="*", default=list(IMPORT_BUDGETS), help="scripts to measure")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per script; the fastest counts")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    _, baseline = time_imports(BASELINE)
+    results = [bench_script(page, args.repeat, baseline) for page in args.pages]
+
+    print(f"{'page':<20}{'seconds':>10}{'budget':>10}  heaviest packages")
+    for row in results:
+        heaviest = ", ".join(f"{name} {value:.2f}" for name, value in row["heaviest"])
+        print(f"{row['page']:<20}{row['seconds']:>10.3f}{row['budget']:>10.2f}  {heaviest}")
+        if row["deferred_imported"]:
+            print(f"{'':<20}imports deferred packages at module level: {', '.join(row['deferred_imported'][:5])}")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"results": results}, file, indent=2)
+
+    failed = [row["page"] for row in results if row["seconds"] > row["budget"] or row["deferred_imported"]]
+    if failed:
+        sys.exit(f"Import budget exceeded: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
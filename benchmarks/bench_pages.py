@@ -0,0 +1,112 @@
+#Rerun cost of the dashboard pages against a synthetic NWFP-shaped dataset.
+#Run from the repository root:
+#    python benchmarks/bench_pages.py --years 9 --freq 15min
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT = os.path.join(ROOT, "project")
+
+#Widget path exercised on every variable page, in order
+PAGES = {
+    "Air Temperature": "Relative Humidity (%RH)",
+    "Relative Humidity": "Air Temperature (°C)",
+    "Wind": "Air Temperature (°C)",
+    "Precipitation": None,
+}
+
+
+def payload_bytes(node):
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        total += proto.ByteSize()
+    for child in getattr(node, "children", {}).values():
+        total += payload_bytes(child)
+    return total
+
+
+#Wall time, peak traced memory and serialized element size of one script run
+def measure(app, action=None):
+    tracemalloc.start()
+    start = time.perf_counter()
+    if action is not None:
+        action(app)
+    app.run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    return {"seconds": elapsed, "peak_mb": peak / 1e6, "payload_kb": payload_bytes(app._tree) / 1e3}
+
+
+def interactions(page, companion):
+    steps = [("cold load", None), ("warm rerun", None)]
+    steps.append(("all graphs", lambda app: app.multiselect[0].set_value(app.multiselect[0].options)))
+    steps.append(("select year", lambda app: app.selectbox(key="year").select_index(1)))
+    steps.append(("select month", lambda app: app.selectbox(key="month").select_index(1)))
+    steps.append(("select day", lambda app: app.selectbox(key="day").select_index(1)))
+    if companion:
+        steps.append(("compare variable", lambda app: app.radio(key="compare").set_value(companion)))
+    steps.append(("raw range", lambda app: app.checkbox(key="raw").check()))
+    return steps
+
+
+def bench_page(page, companion, timeout):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    app = AppTest.from_file(os.path.join(PROJECT, "pages", f"{page}.py"), default_timeout=timeout)
+    results = []
+    for name, action in interactions(page, companion):
+        results.append({"page": page, "interaction": name, **measure(app, action)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page reruns against synthetic NWFP MET data.")
+    parser.add_argument("--years", type=int, default=9, help="years of synthetic data")
+    parser.add_argument("--freq", default="15min", help="sampling interval of the synthetic data")
+    parser.add_argument("--pages", nargs="*", default=list(PAGES), help="pages to benchmark")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds allowed per script run")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    #The app resolves its assets relative to the repository root and imports met from project/
+    os.chdir(ROOT)
+    sys.path.insert(0, PROJECT)
+
+    with tempfile.TemporaryDirectory() as directory:
+        #met reads its paths once, when first imported, so they are set before any met import
+        data_path = os.path.join(directory, "synthetic.parquet")
+        os.environ["NWFP_MET_DATA"] = data_path
+        os.environ["NWFP_MET_STORE"] = os.path.join(directory, "no_store")
+        #A fresh persistent cache keeps "cold load" cold and the project's own cache untouched
+        os.environ["NWFP_MET_CACHE"] = os.path.join(directory, "cache")
+        from met.synthetic import generate
+
+        generate(args.years, freq=args.freq).to_parquet(data_path)
+
+        results = []
+        for page in args.pages:
+            results.extend(bench_page(page, PAGES[page], args.timeout))
+
+    print(f"{'page':<20}{'interaction':<20}{'seconds':>10}{'peak MB':>10}{'payload kB':>12}")
+    for row in results:
+        print(f"{row['page']:<20}{row['interaction']:<20}{row['seconds']:>10.3f}{row['peak_mb']:>10.1f}{row['payload_kb']:>12.1f}")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"years": args.years, "freq": args.freq, "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
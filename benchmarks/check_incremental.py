@@ -0,0 +1,73 @@
+#Checks that an archive's parts fed in drops match the same parts built from the whole
+#frame at once: the appended frame, the cube's hourly state and levels, the partition index
+#and the per-period extremes must agree, whatever hour, day or month a drop starts in.
+#Run from the repository root:
+#    python benchmarks/check_incremental.py --years 2 --drops 5
+import argparse
+import os
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT = os.path.join(ROOT, "project")
+
+
+#Split positions chosen so drops start mid-hour and mid-month
+def split_points(rows, drops):
+    return [rows * part // drops + 3 for part in range(1, drops)]
+
+
+def compare(name, expected, actual):
+    import pandas as pd
+
+    pd.testing.assert_frame_equal(expected, actual, check_dtype=False, check_freq=False, rtol=1e-9, atol=1e-9,
+                                  obj=name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare incremental archive updates against a full rebuild.")
+    parser.add_argument("--years", type=int, default=2, help="years of synthetic data")
+    parser.add_argument("--freq", default="15min", help="sampling interval of the synthetic data")
+    parser.add_argument("--drops", type=int, default=5, help="number of drops the frame is split into")
+    args = parser.parse_args()
+
+    sys.path.insert(0, PROJECT)
+    from met.aggregates import RESOLUTIONS, AggregateCube
+    from met.data import append_compact, compact
+    from met.partition import PartitionIndex
+    from met.stats import PeriodStatistics, extreme_frames
+    from met.synthetic import generate
+
+    raw = generate(args.years, freq=args.freq)
+    df = compact(raw)
+    full = AggregateCube(df)
+    bounds = [0] + split_points(len(df), args.drops) + [len(df)]
+    frame = compact(raw.iloc[bounds[0]:bounds[1]])
+    cube = AggregateCube(frame)
+    partitions = PartitionIndex(frame.index)
+    stats = PeriodStatistics(extreme_frames(cube), dict)
+    for start, stop in zip(bounds[1:-1], bounds[2:]):
+        new = raw.iloc[start:stop]
+        frame = append_compact(frame, new)
+        cube.update(df.iloc[start:stop])
+        partitions = partitions.extended(frame.index, new.index[0])
+        stats.update(cube, new.index[0])
+
+    compare("appended frame", df.astype({name: object for name in df.select_dtypes("category")}),
+            frame.astype({name: object for name in frame.select_dtypes("category")}))
+    assert partitions._days == PartitionIndex(df.index)._days, "partition index differs from a full rebuild"
+    for name, table in extreme_frames(full).items():
+        compare(name, table, stats.to_frames()[name])
+
+    expected_sums, expected_counts = full.hourly()
+    sums, counts = cube.hourly()
+    compare("hourly sums", expected_sums, sums)
+    compare("hourly counts", expected_counts, counts)
+    for rule in RESOLUTIONS:
+        compare(f"level {rule}", full.level(rule), cube.level(rule))
+    print(f"{args.drops} drops of {len(df)} rows match a full rebuild at {', '.join(RESOLUTIONS)}, "
+          f"including the frame, partition index and extremes")
+
+
+if __name__ == "__main__":
+    main()
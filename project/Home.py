@@ -1,8 +1,9 @@
 #Import necessary libraries
 import streamlit as st
-import streamlit.components.v1 as components
-import plotly.express as px
-import pandas as pd
+from met.data import select_station
+from met.histograms import load_quality_counts
+from met.persist import source_fingerprint
+from met.profiling import plotly_chart, profile_panel
 
 
 
@@ -39,18 +40,9 @@ st.write(f"This web application provides visualizations of seasonal changes of t
 st.markdown('👉[Click here to visit Tableau Public](https://public.tableau.com/app/profile/gulce.alper4379/viz/NWFPMET/Dashboard)')
 
 
-#Loading and caching data from local file
-@st.cache_data
-def load_data():
-    df = pd.read_parquet("project/new_df.parquet")
-    return df
-
-
-if 'data' not in st.session_state:
-    st.session_state.data = load_data()
-
-# Access the data from session state
-df = st.session_state.data
+#Counts of each quality flag per variable, computed once on the server
+station = select_station()
+quality_counts = load_quality_counts(station, source_fingerprint())
 
 
 #Placing NWFP map image and Plotly stacked bar chart side by side
@@ -58,10 +50,11 @@ col1, col2 = st.columns([1, 2])
 with col1:
     st.image("project/nwfp.png")
     st.markdown('<p style="text-align: center; font-size: 50px, font-weight: bold; color: black;">NWFP Map</p>', unsafe_allow_html=True)
-melted_df = df.melt(value_vars=['Precipitation (mm) Quality', 'Air Temperature (°C) Quality', 
-                                'Relative Humidity (%RH) Quality', 'Wind Speed (km/h) Quality', 'Wind Direction (°) Quality'], var_name='Category', value_name='Value')
 with col2:
-    fig = px.histogram(melted_df, x='Value', color='Category', barmode='stack')
+    #plotly.express is not loaded with streamlit, so it is imported once the chart panel is reached
+    import plotly.express as px
+
+    fig = px.bar(quality_counts, x='Value', y='Count', color='Category', barmode='stack')
     new_legend_titles = {
         'Precipitation (mm) Quality': 'Precipitation',
         'Air Temperature (°C) Quality': 'Air Temperature',
@@ -82,24 +75,7 @@ with col2:
         width=300,
         height=500,
         legend=dict(title=None, orientation='h', yanchor='bottom', y=-0.2, xanchor='center', x=0.5,))
-    st.plotly_chart(fig)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+    plotly_chart(fig)
 
 
+profile_panel()
@@ -0,0 +1,155 @@
+#Multi-resolution aggregates of the MET variables, built once per process and station
+import numpy as np
+import pandas as pd
+
+from met.data import PRECIPITATION, VARIABLES, WIND_DIRECTION, WIND_SPEED
+from met.partition import slice_period
+from met.quality import EXCLUDED_FLAGS, masked_values
+from met.wind import RESULTANT_WIND_SPEED, WIND_U, WIND_V, vector_mean, wind_components
+
+
+#Resample rules served by the cube, from coarsest to finest
+RESOLUTIONS = ("YE", "ME", "D", "h")
+
+#Names of the frames a cube is saved as in the persistent cache
+CUBE_FRAMES = ("sums", "counts") + tuple(f"level-{rule}" for rule in RESOLUTIONS)
+
+#Variables reported as totals rather than averages
+SUM_VARIABLES = (PRECIPITATION,)
+
+
+def count_column(variable):
+    return f"{variable} Count"
+
+
+def coverage_column(variable):
+    return f"{variable} Coverage"
+
+
+#Length of each bucket of a level, from its labels
+def bucket_durations(index, rule):
+    if rule == "YE":
+        return pd.to_timedelta(np.where(index.is_leap_year, 366, 365), unit="D")
+    if rule == "ME":
+        return pd.to_timedelta(index.days_in_month, unit="D")
+    return pd.to_timedelta(np.ones(len(index)), unit=rule)
+
+
+#Typical spacing of the samples (the median over the first 100,000 gaps), used to
+#turn counts into coverage
+def sampling_interval(index):
+    if len(index) < 2:
+        return pd.Timedelta(hours=1)
+    return pd.Series(index[:100_001]).diff().median()
+
+
+#Hourly sums and valid-sample counts. Both are additive, so every coarser
+#resolution is rolled up from them instead of resampling the raw series again.
+#Samples with an excluded quality flag are masked once per variable before summing,
+#and wind is also carried as summed u/v components for vector averaging. Sums are
+#accumulated in float64 even though the loaded frame holds float32.
+def hourly_state(df, variables=VARIABLES, excluded=EXCLUDED_FLAGS):
+    values = masked_values(df, variables, excluded)
+    if WIND_DIRECTION in variables and WIND_SPEED in variables:
+        u, v = wind_components(values[WIND_DIRECTION].to_numpy(), values[WIND_SPEED].to_numpy())
+        values = values.assign(**{WIND_U: u, WIND_V: v})
+    hourly = values.resample("h")
+    return hourly.sum(), hourly.count()
+
+
+def roll_up(sums, counts, rule):
+    if rule == "h":
+        return sums, counts
+    return sums.resample(rule).sum(), counts.resample(rule).sum()
+
+
+#Turning sums and counts into the values shown on the pages: totals for
+#precipitation, vector means for wind direction and plain means (NaN where a
+#bucket has no samples) for everything else. Each variable keeps its valid-sample
+#count and its coverage, the share of the bucket's expected samples that were valid.
+#Buckets of uneven length (e.g. a clipped first month) pass their own `durations`.
+def finalize(sums, counts, rule="h", interval=pd.Timedelta(hours=1), durations=None):
+    expected = (bucket_durations(sums.index, rule) if durations is None else durations) / interval
+    columns = {}
+    for variable in sums.columns.drop([WIND_U, WIND_V], errors="ignore"):
+        if variable in SUM_VARIABLES:
+            columns[variable] = sums[variable]
+        else:
+            columns[variable] = sums[variable] / counts[variable].where(counts[variable] > 0)
+        columns[count_column(variable)] = counts[variable]
+        columns[coverage_column(variable)] = (counts[variable] / expected).clip(upper=1.0)
+    if WIND_U in sums.columns:
+        direction, speed = vector_mean(sums[WIND_U], sums[WIND_V], counts[WIND_U])
+        columns[WIND_DIRECTION] = pd.Series(direction, index=sums.index)
+        columns[RESULTANT_WIND_SPEED] = pd.Series(speed, index=sums.index)
+    return pd.DataFrame(columns)
+
+
+#First timestamp of the bucket containing `timestamp` at a resample rule
+def bucket_start(timestamp, rule):
+    if rule == "YE":
+        return pd.Timestamp(year=timestamp.year, month=1, day=1)
+    if rule == "ME":
+        return pd.Timestamp(year=timestamp.year, month=timestamp.month, day=1)
+    return timestamp.floor(rule)
+
+
+class AggregateCube:
+    def __init__(self, df, variables=VARIABLES, excluded=EXCLUDED_FLAGS):
+        self.variables = tuple(variables)
+        self.excluded = tuple(excluded)
+        self.interval = sampling_interval(df.index)
+        self._sums, self._counts = hourly_state(df, self.variables, self.excluded)
+        self._levels = {rule: self._finalize(self._sums, self._counts, rule) for rule in RESOLUTIONS}
+
+    #Rebuilding a cube from the frames produced by to_frames(), without touching raw data
+    @classmethod
+    def from_frames(cls, frames, interval, variables=VARIABLES, excluded=EXCLUDED_FLAGS):
+        cube = cls.__new__(cls)
+        cube.variables, cube.excluded, cube.interval = tuple(variables), tuple(excluded), interval
+        cube._sums, cube._counts = frames["sums"], frames["counts"]
+        cube._levels = {rule: frames[f"level-{rule}"] for rule in RESOLUTIONS}
+        return cube
+
+    def to_frames(self):
+        frames = {"sums": self._sums, "counts": self._counts}
+        frames.update({f"level-{rule}": level for rule, level in self._levels.items()})
+        return frames
+
+    def level(self, rule):
+        return self._levels[rule]
+
+    #Hourly sums and counts on a gap-free hourly index
+    def hourly(self):
+        return self._sums, self._counts
+
+    #Aggregates at one resolution restricted to a calendar year, month or day
+    def period(self, rule, year, month=None, day=None):
+        return slice_period(self._levels[rule], year, month, day)
+
+    #Adding newly ingested rows: their hourly sums and counts are merged into the stored
+    #state, then only the buckets from the first affected one onwards are rolled up
+    #again at each resolution. For a drop of recent data that is the last hours, day,
+    #month and year.
+    def update(self, df):
+        if not len(df):
+            return
+        sums, counts = hourly_state(df, self.variables, self.excluded)
+        first = sums.index[0]
+        self._sums = self._merge(self._sums, sums, first)
+        self._counts = self._merge(self._counts, counts, first).astype(np.int64)
+        for rule in RESOLUTIONS:
+            start = bucket_start(first, rule)
+            affected = self._sums.index >= start
+            recomputed = self._finalize(self._sums[affected], self._counts[affected], rule)
+            level = self._levels[rule]
+            self._levels[rule] = pd.concat([level[level.index < recomputed.index[0]], recomputed])
+
+    def _finalize(self, sums, counts, rule):
+        return finalize(*roll_up(sums, counts, rule), rule, self.interval)
+
+    @staticmethod
+    def _merge(state, new, first):
+        before = state[state.index < first]
+        merged = state[state.index >= first].add(new, fill_value=0)
+        return pd.concat([before, merged]).asfreq("h", fill_value=0)
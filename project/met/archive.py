@@ -0,0 +1,120 @@
+#Per-station archive that picks up newly appended store partitions without a full reload
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+
+from met.aggregates import CUBE_FRAMES, AggregateCube, sampling_interval
+from met.data import QUALITY_COLUMNS, VARIABLES, append_compact, list_stations, load_frame
+from met.partition import PartitionIndex
+from met.profiling import frame_bytes, timed
+from met.persist import PersistentCache, source_fingerprint
+from met.stats import EXTREME_FRAMES, SUMMARY_FRAMES, PeriodStatistics, extreme_frames, summary_frames
+from met.store import manifest_path, read_manifest, read_part, store_exists
+
+
+#Columns held by an archive: the measurements plus their quality flags
+ARCHIVE_COLUMNS = VARIABLES + QUALITY_COLUMNS
+
+
+def manifest_mtime():
+    try:
+        return os.stat(manifest_path()).st_mtime_ns
+    except OSError:
+        return None
+
+
+#Frame, aggregate cube, partition index and summary statistics of one station. `version`
+#increases with every ingested drop, so caches derived from the frame can use it as part
+#of their key. The cube and statistics come from the persistent cache when it holds them
+#for the current source, so a restart only has to read the frame itself. A drop only
+#touches the buckets, days and periods it falls in; the whole-record summary is left to
+#be computed when next asked for.
+class Archive:
+    def __init__(self, station, columns=ARCHIVE_COLUMNS):
+        self.station = station
+        self.columns = tuple(columns)
+        self.version = 0
+        self._lock = threading.Lock()
+        #Taking the manifest position before reading means a file appended during the
+        #read is seen again by refresh(); its rows are then dropped as duplicates
+        self._mtime = manifest_mtime()
+        self._sequence = max((entry["sequence"] for entry in read_manifest()), default=0) if store_exists() else 0
+        self.cache = PersistentCache(source_fingerprint(), station)
+        with timed("read frame", station=station) as entry:
+            self.frame = load_frame(self.columns, station=station)
+            entry.update(rows=len(self.frame), bytes=frame_bytes(self.frame))
+        self.partitions = PartitionIndex(self.frame.index)
+        with timed("aggregate cube", station=station):
+            cube_frames = self.cache.frames(CUBE_FRAMES, lambda: AggregateCube(self.frame).to_frames())
+            self.cube = AggregateCube.from_frames(cube_frames, sampling_interval(self.frame.index))
+        with timed("statistics", station=station):
+            self.stats = PeriodStatistics(self.cache.frames(EXTREME_FRAMES, lambda: extreme_frames(self.cube)),
+                                          self._summary_frames)
+
+    #Summary of the current frame, from the persistent cache when it holds it. Taken under
+    #the lock so a refresh cannot swap the frame or the cache halfway through.
+    def _summary_frames(self):
+        with self._lock, timed("summary statistics", station=self.station):
+            return self.cache.frames(SUMMARY_FRAMES, lambda: summary_frames(self.frame))
+
+    #Reading the manifest entries of this station written since the last look and merging
+    #their rows into the frame, cube, partition index and statistics. Returns whether anything changed.
+    def refresh(self):
+        if not store_exists() or manifest_mtime() == self._mtime:
+            return False
+        with self._lock, timed("refresh", station=self.station) as entry:
+            self._mtime = manifest_mtime()
+            entries = [entry for entry in read_manifest() if entry["sequence"] > self._sequence]
+            new = pd.DataFrame()
+            if entries:
+                self._sequence = max(entry["sequence"] for entry in entries)
+                parts = [read_part(entry, self.columns) for entry in entries if entry["station"] == str(self.station)]
+                new = pd.concat(parts).sort_index(kind="stable") if parts else new
+                if len(new):
+                    #Only the rows held from the first new timestamp on can repeat it
+                    held = self.frame.index[self.frame.index.searchsorted(new.index[0]):]
+                    new = new[~new.index.duplicated(keep="first") & ~new.index.isin(held)]
+            entry["rows"] = len(new)
+            if len(new):
+                self.frame = append_compact(self.frame, new)
+                self.cube.update(new)
+                self.partitions = self.partitions.extended(self.frame.index, new.index[0])
+                self.stats.update(self.cube, new.index[0])
+                self.version += 1
+            #The source fingerprint changes with the manifest even when none of the new rows
+            #belong to this station, so its artifacts move to the new directory either way
+            fingerprint = source_fingerprint()
+            if len(new) or fingerprint != self.cache.fingerprint:
+                self.cache = PersistentCache(fingerprint, self.station)
+                self.cache.save_all(self.cube.to_frames())
+                self.cache.save_all(self.stats.to_frames())
+            return bool(len(new))
+
+
+@st.cache_resource(show_spinner=False)
+def load_archive(station):
+    return Archive(station)
+
+
+#Archives of every station, built side by side in worker threads (reading and resampling
+#run mostly in pyarrow and NumPy, outside the GIL). The workers share the script context
+#so that their load_archive calls land in the same cache as the pages' own calls.
+@st.cache_resource(show_spinner="Loading NWFP MET data...")
+def load_archives():
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+    context = get_script_run_ctx()
+    stations = list_stations()
+    with ThreadPoolExecutor(max_workers=min(len(stations), 8),
+                            initializer=lambda: add_script_run_ctx(threading.current_thread(), context)) as pool:
+        return dict(zip(stations, pool.map(load_archive, stations)))
+
+
+#Archive of a station, brought up to date with any partitions appended since the last rerun
+def current_archive(station):
+    archive = load_archives()[station]
+    archive.refresh()
+    return archive
@@ -0,0 +1,80 @@
+#Multi-year normals and anomalies. Normals are built from the cube's daily and hourly
+#levels in one grouped pass per level: the mean and percentiles of every variable for
+#each calendar day, and for each hour of the day within each calendar month.
+import pandas as pd
+import streamlit as st
+
+from met.aggregates import coverage_column
+from met.archive import load_archive
+from met.data import VARIABLES, WIND_DIRECTION
+from met.profiling import timed
+
+
+PERCENTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+#Directions in degrees have no meaningful percentiles
+NORMAL_VARIABLES = tuple(variable for variable in VARIABLES if variable != WIND_DIRECTION)
+
+#Buckets with less valid data than this are left out of the normals, so an outage
+#does not read as a dry or calm day
+MIN_COVERAGE = 0.8
+
+CLIMATOLOGY_FRAMES = ("normals-day", "normals-hour")
+
+#Leap year used to place calendar days on a date axis
+REFERENCE_YEAR = 2000
+
+
+#Calendar day as month * 100 + day, so 29 February keeps its own normal
+def day_keys(index):
+    return pd.Index(index.month * 100 + index.day, name="day")
+
+
+def hour_keys(index):
+    return pd.MultiIndex.from_arrays([index.month, index.hour], names=["month", "hour"])
+
+
+def reference_dates(keys):
+    return pd.to_datetime(REFERENCE_YEAR * 10000 + keys.to_numpy(), format="%Y%m%d")
+
+
+def screened(level, variables=NORMAL_VARIABLES):
+    return pd.DataFrame({variable: level[variable].where(level[coverage_column(variable)] >= MIN_COVERAGE)
+                         for variable in variables})
+
+
+#Mean and percentiles of every column per key, as (variable, statistic) columns
+def normals(values, keys):
+    grouped = values.groupby(keys)
+    mean = grouped.mean()
+    mean.columns = pd.MultiIndex.from_product([mean.columns, ["mean"]])
+    quantiles = grouped.quantile(list(PERCENTILES))
+    quantiles.index = quantiles.index.set_names("quantile", level=-1)
+    quantiles = quantiles.unstack("quantile")
+    quantiles.columns = pd.MultiIndex.from_tuples(
+        [(variable, f"p{round(quantile * 100)}") for variable, quantile in quantiles.columns])
+    return pd.concat([mean, quantiles], axis=1)
+
+
+def climatology(cube, variables=NORMAL_VARIABLES):
+    daily, hourly = screened(cube.level("D"), variables), screened(cube.level("h"), variables)
+    return {
+        "normals-day": normals(daily, day_keys(daily.index)),
+        "normals-hour": normals(hourly, hour_keys(hourly.index)),
+    }
+
+
+#A series of one variable beside its normals for the same calendar day (rule "D") or
+#month and hour (rule "h"), with its departure from the normal mean
+def anomalies(series, climate, rule):
+    variable_normals = climate["normals-day" if rule == "D" else "normals-hour"][series.name]
+    keys = day_keys(series.index) if rule == "D" else hour_keys(series.index)
+    frame = variable_normals.reindex(keys).set_axis(series.index)
+    return frame.assign(value=series.to_numpy(), anomaly=series.to_numpy() - frame["mean"].to_numpy())
+
+
+@st.cache_data(show_spinner="Computing normals...")
+def load_climatology(station, version=0):
+    archive = load_archive(station)
+    with timed("climatology", station=station):
+        return archive.cache.frames(CLIMATOLOGY_FRAMES, lambda: climatology(archive.cube))
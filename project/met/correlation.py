@@ -0,0 +1,144 @@
+#Relationships between variables, pre-aggregated on the server: correlation matrices and
+#2-D density grids (hexagonal or rectangular) of a period, so the browser receives a few
+#thousand cells instead of a scatter of every sample
+import math
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from met.archive import load_archive
+from met.data import VARIABLES, WIND_DIRECTION
+from met.profiling import timed
+from met.quality import masked_values
+
+
+#Directions in degrees do not correlate linearly with anything
+CORRELATION_VARIABLES = tuple(variable for variable in VARIABLES if variable != WIND_DIRECTION)
+
+DEFAULT_GRIDSIZE = 40
+
+#Hexagon corners relative to a center, in units of the horizontal and vertical spacing
+HEXAGON = np.array([[0.5, -0.5], [0.5, 0.5], [0.0, 1.0], [-0.5, 0.5], [-0.5, -0.5], [0.0, -1.0]]) * [1.0, 1.0 / 3.0]
+
+#Color classes of the hexbin figure; each class is drawn as one filled trace
+DENSITY_CLASSES = 8
+
+
+#Pearson correlations over pairwise-complete samples, from a handful of matrix products:
+#a sample missing one variable still counts for every pair that does not involve it
+def correlation_matrix(values):
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    weights = present.astype(np.float64)
+    counts = weights.T @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sums = filled.T @ weights
+        squares = (filled ** 2).T @ weights
+        products = filled.T @ filled
+        means = sums / counts
+        covariance = products / counts - means * means.T
+        variance = squares / counts - means ** 2
+        return covariance / np.sqrt(variance * variance.T), counts
+
+
+#Counts per hexagon of a grid `gridsize` hexagons wide, in the manner of matplotlib's
+#hexbin: points are assigned to the nearer center of two offset rectangular lattices.
+#Returns the occupied centers with their counts, and the horizontal and vertical spacing.
+def hexbin_counts(x, y, gridsize=DEFAULT_GRIDSIZE):
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if not len(x):
+        return pd.DataFrame({"x": [], "y": [], "count": []}), (1.0, 1.0)
+    nx = gridsize
+    ny = max(int(nx / math.sqrt(3)), 1)
+    sx = (x.max() - x.min()) / nx or 1.0
+    sy = (y.max() - y.min()) / ny or 1.0
+    ix, iy = (x - x.min()) / sx, (y - y.min()) / sy
+    ix1, iy1 = np.round(ix), np.round(iy)
+    ix2, iy2 = np.floor(ix), np.floor(iy)
+    first = (ix - ix1) ** 2 + 3.0 * (iy - iy1) ** 2 < (ix - ix2 - 0.5) ** 2 + 3.0 * (iy - iy2 - 0.5) ** 2
+    cells = np.column_stack([np.where(first, ix1, ix2 + 0.5), np.where(first, iy1, iy2 + 0.5)])
+    centers, counts = np.unique(cells, axis=0, return_counts=True)
+    frame = pd.DataFrame({"x": centers[:, 0] * sx + x.min(), "y": centers[:, 1] * sy + y.min(), "count": counts})
+    return frame, (sx, sy)
+
+
+#Counts on a bins x bins rectangular grid, with the cell centers along each axis
+def grid_counts(x, y, bins=DEFAULT_GRIDSIZE):
+    finite = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=bins)
+    return counts.T, (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2
+
+
+def period_values(station, variables, year=None, month=None, day=None):
+    archive = load_archive(station)
+    df = archive.frame
+    if year is not None:
+        df = archive.partitions.slice(df, year, month, day)
+    return masked_values(df, list(variables))
+
+
+@st.cache_data(show_spinner=False)
+def load_correlation(year=None, month=None, day=None, station=None, version=0):
+    with timed("correlation", year=year, month=month, day=day):
+        values = period_values(station, CORRELATION_VARIABLES, year, month, day)
+        matrix, counts = correlation_matrix(values.to_numpy(dtype=np.float64))
+        return (pd.DataFrame(matrix, index=values.columns, columns=values.columns),
+                pd.DataFrame(counts.astype(np.int64), index=values.columns, columns=values.columns))
+
+
+#Density of a variable pair in a period: hexagon centers and counts ("hexbin") or a
+#rectangular grid ("heatmap")
+@st.cache_data(show_spinner=False)
+def load_density(x, y, kind="hexbin", gridsize=DEFAULT_GRIDSIZE, year=None, month=None, day=None, station=None,
+                 version=0):
+    with timed("density", kind=kind, pair=f"{x} / {y}", gridsize=gridsize) as entry:
+        values = period_values(station, dict.fromkeys([x, y]), year, month, day)
+        entry["rows"] = len(values)
+        arrays = values[x].to_numpy(dtype=np.float64), values[y].to_numpy(dtype=np.float64)
+        if kind == "hexbin":
+            return hexbin_counts(*arrays, gridsize)
+        return grid_counts(*arrays, gridsize)
+
+
+def correlation_figure(matrix, height=400):
+    labels = [label.split(" (")[0] for label in matrix.columns]
+    fig = go.Figure(go.Heatmap(z=matrix.to_numpy(), x=labels, y=labels, zmin=-1, zmax=1, colorscale="RdBu_r",
+                               text=np.round(matrix.to_numpy(), 2), texttemplate="%{text}"))
+    fig.update_layout(height=height, margin=dict(t=0, b=0, l=0, r=0), yaxis=dict(autorange="reversed"))
+    return fig
+
+
+#Hexagons drawn as filled outlines, grouped into color classes by log count so the whole
+#grid is a handful of traces
+def hexbin_figure(hexagons, spacing, x, y, height=500):
+    import plotly.express as px
+
+    fig = go.Figure()
+    if len(hexagons):
+        corners = HEXAGON * spacing
+        levels = np.log10(hexagons["count"].to_numpy())
+        classes = np.minimum((levels / (levels.max() or 1.0) * DENSITY_CLASSES).astype(int), DENSITY_CLASSES - 1)
+        colors = px.colors.sample_colorscale("Blues", np.linspace(0.25, 1.0, DENSITY_CLASSES))
+        for level, color in enumerate(colors):
+            selected = hexagons[classes == level]
+            if not len(selected):
+                continue
+            xs = (selected["x"].to_numpy()[:, None] + np.append(corners[:, 0], [corners[0, 0], np.nan])).ravel()
+            ys = (selected["y"].to_numpy()[:, None] + np.append(corners[:, 1], [corners[0, 1], np.nan])).ravel()
+            low, high = selected["count"].min(), selected["count"].max()
+            fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", fill="toself", fillcolor=color, line=dict(width=0),
+                                     name=f"{low}-{high} samples", hoverinfo="name"))
+    fig.update_layout(height=height, margin=dict(t=0, b=0, l=0, r=0), xaxis_title=x, yaxis_title=y,
+                      legend=dict(title="Samples per hexagon"))
+    return fig
+
+
+def heatmap_figure(grid, x, y, height=500):
+    counts, x_centers, y_centers = grid
+    fig = go.Figure(go.Heatmap(z=np.where(counts > 0, counts, np.nan), x=x_centers, y=y_centers, colorscale="Blues",
+                               colorbar=dict(title="Samples")))
+    fig.update_layout(height=height, margin=dict(t=0, b=0, l=0, r=0), xaxis_title=x, yaxis_title=y)
+    return fig
@@ -0,0 +1,130 @@
+#Shared data access for every page of the dashboard
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import streamlit as st
+from pandas.api.types import union_categoricals
+
+from met.store import read_store, store_exists, stored_stations
+
+
+#Source file, overridable for benchmarks and load tests
+DATA_PATH = os.environ.get("NWFP_MET_DATA", "project/new_df.parquet")
+
+PRECIPITATION = "Precipitation (mm)"
+AIR_TEMPERATURE = "Air Temperature (°C)"
+RELATIVE_HUMIDITY = "Relative Humidity (%RH)"
+WIND_SPEED = "Wind Speed (km/h)"
+WIND_DIRECTION = "Wind Direction (°)"
+
+VARIABLES = (PRECIPITATION, AIR_TEMPERATURE, RELATIVE_HUMIDITY, WIND_SPEED, WIND_DIRECTION)
+STATION = "Station"
+
+#Name given to the rows of a file without a Station column
+DEFAULT_STATION = "North Wyke"
+
+QUALITY_COLUMNS = tuple(f"{variable} Quality" for variable in VARIABLES)
+
+logger = logging.getLogger(__name__)
+
+
+#Stations in the source file, read from the Station column alone
+def file_stations(path=DATA_PATH):
+    if STATION not in pq.read_schema(path).names:
+        return [DEFAULT_STATION]
+    return sorted(pd.read_parquet(path, columns=[STATION])[STATION].unique().tolist())
+
+
+#Reading only the requested columns, time range and station. The partitioned store pushes
+#all three filters down to the parquet reader; the single-file fallback pushes the station
+#filter down and slices the time range after reading. The pages always read whole
+#stations into the archive and slice periods in memory, so start/end are only used by
+#scripts reading a window of the store directly.
+def read_frame(columns=None, start=None, end=None, station=None, path=DATA_PATH):
+    if store_exists():
+        return read_store(columns, start, end, station)
+    filters = None
+    if STATION in pq.read_schema(path).names:
+        filters = [(STATION, "==", station if station is not None else file_stations(path)[0])]
+    df = pd.read_parquet(path, columns=list(columns) if columns else None, filters=filters)
+    df = df.drop(columns=STATION, errors="ignore")
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    if start is not None or end is not None:
+        df = df.loc[start:end]
+    return df
+
+
+#Measurements downcast to read-only float32 arrays and quality flags stored as
+#categoricals (int8 codes into a handful of labels). The bytes before and after
+#are kept in df.attrs["compaction"].
+def compact(df):
+    before = int(df.memory_usage(deep=True).sum())
+    columns = {}
+    for name, column in df.items():
+        if name in QUALITY_COLUMNS:
+            columns[name] = column.astype("category")
+        elif pd.api.types.is_float_dtype(column):
+            values = column.to_numpy(dtype=np.float32, copy=True)
+            values.flags.writeable = False
+            columns[name] = pd.Series(values, index=df.index, name=name, copy=False)
+        else:
+            columns[name] = column
+    compacted = pd.DataFrame(columns, index=df.index, copy=False)
+    after = int(compacted.memory_usage(deep=True).sum())
+    compacted.attrs["compaction"] = {"before": before, "after": after, "saved": before - after}
+    return compacted
+
+
+#A compacted frame with the rows of `new` appended. Only `new` is compacted: flag labels
+#not seen before are added after the existing categories, so the codes of the rows
+#already held stay as they are. Sorted again only when `new` reaches back in time.
+def append_compact(df, new):
+    columns = {}
+    for name, column in df.items():
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            labels = np.asarray(new[name], dtype=object)
+            categories = column.cat.categories
+            extra = pd.Index(pd.unique(labels[pd.notna(labels)])).difference(categories)
+            if len(extra):
+                categories = categories.append(extra)
+                column = column.cat.set_categories(categories)
+            values = union_categoricals([column.array, pd.Categorical(labels, categories=categories)])
+        else:
+            values = np.concatenate([column.to_numpy(), new[name].to_numpy(dtype=column.dtype)])
+            values.flags.writeable = False
+        columns[name] = values
+    appended = pd.DataFrame(columns, index=df.index.append(new.index), copy=False)
+    if not appended.index.is_monotonic_increasing:
+        appended = appended.sort_index(kind="stable")
+    appended.attrs["compaction"] = df.attrs.get("compaction", {})
+    return appended
+
+
+@st.cache_resource(show_spinner=False)
+def list_stations():
+    return stored_stations() if store_exists() else file_stations()
+
+
+#Sidebar selector, shown only when the data holds more than one station
+def select_station():
+    stations = list_stations()
+    if len(stations) == 1:
+        return stations[0]
+    return st.sidebar.selectbox("Select Station:", stations, key="station")
+
+
+#Reading and compacting one station's columns and time range, logging what compaction
+#saved. The single loader behind the archives and the column-projected panels; callers
+#own the result, so it is not cached here. Without a station the first one is read.
+def load_frame(columns=VARIABLES, start=None, end=None, station=None):
+    if station is None:
+        station = list_stations()[0]
+    df = compact(read_frame(columns, start, end, station))
+    report = df.attrs["compaction"]
+    logger.info("Loaded %s: %d rows x %d columns, %.1f MB (%.1f MB saved by compaction)",
+                station, len(df), len(df.columns), report["after"] / 1e6, report["saved"] / 1e6)
+    return df
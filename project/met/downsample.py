@@ -0,0 +1,64 @@
+#Reducing long series to a fixed point budget before they are sent to the browser
+import numpy as np
+import pandas as pd
+
+from met.profiling import timed
+
+
+#Points per trace, about one per horizontal pixel of a full-width chart
+DEFAULT_POINTS = 1500
+
+
+#Numeric x positions for the triangle areas; datetimes become integer ticks
+def _positions(index):
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(np.float64)
+    return np.asarray(index, dtype=np.float64)
+
+
+#Largest-triangle-three-buckets: the first and last points are kept and each bucket in
+#between keeps the point forming the largest triangle with the previously kept point
+#and the average of the next bucket. Missing values are dropped first.
+def lttb_indices(x, y, points):
+    n = len(y)
+    if points >= n or points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    for bucket in range(points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x, next_y = x[stop:next_stop].mean(), y[stop:next_stop].mean()
+        a = selected[bucket]
+        area = np.abs((x[a] - next_x) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (next_y - y[a]))
+        selected[bucket + 1] = start + int(np.argmax(area))
+    return selected
+
+
+#Min/max envelope: each bucket keeps its lowest and highest point in time order,
+#so spikes (e.g. rainfall peaks) survive. Buckets are equal-sized rows of a padded matrix.
+def minmax_indices(y, points):
+    n = len(y)
+    buckets = max(points // 2, 1)
+    if points >= n:
+        return np.arange(n)
+    size = -(-n // buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows = offsets + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+    return np.unique(np.clip(np.concatenate([lows, highs]), 0, n - 1))
+
+
+def downsample(series, points=DEFAULT_POINTS, mode="lttb"):
+    if len(series) <= points:
+        return series
+    with timed("downsample", mode=mode, rows=len(series)):
+        if mode == "minmax":
+            return series.iloc[minmax_indices(series.to_numpy(dtype=np.float64), points)]
+        series = series.dropna()
+        indices = lttb_indices(_positions(series.index), series.to_numpy(dtype=np.float64), points)
+        return series.iloc[indices]
@@ -0,0 +1,51 @@
+#Pre-binned counts for the histogram panels
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from met.archive import load_archive
+from met.data import QUALITY_COLUMNS, load_frame
+from met.persist import PersistentCache
+from met.profiling import timed
+from met.quality import masked_values
+
+
+#Number of samples carrying each quality flag, one column per quality column
+def quality_counts(df, columns=QUALITY_COLUMNS):
+    counts = pd.DataFrame({column: df[column].value_counts() for column in columns})
+    return counts.fillna(0).astype(np.int64)
+
+
+#Counts of the finite values in fixed-edge bins. `bins` is either a number of
+#equal-width bins spanning the data or an explicit array of edges.
+def bin_counts(values, bins=40):
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if not len(values) and np.ndim(bins) == 0:
+        return np.zeros(bins, dtype=np.int64), np.linspace(0.0, 1.0, bins + 1)
+    return np.histogram(values, bins=bins)
+
+
+#Quality counts in long form, ready for a stacked bar chart. Only the quality columns are
+#read, without loading the station's archive. Cached per station and source fingerprint,
+#so an ingested drop is counted on the next request.
+@st.cache_data(show_spinner=False)
+def load_quality_counts(station, fingerprint=None):
+    @timed("quality counts", station=station)
+    def build():
+        counts = quality_counts(load_frame(QUALITY_COLUMNS, station=station))
+        return counts.rename_axis("Value").reset_index().melt(id_vars="Value", var_name="Category", value_name="Count")
+    return PersistentCache(fingerprint, station).frame("quality-counts", build)
+
+
+#Bin counts and edges of a variable, kept on disk as one row per bin
+@st.cache_data(show_spinner=False)
+def load_bin_counts(variable, bins, station, version=0):
+    archive = load_archive(station)
+
+    @timed("bin counts", variable=variable, station=station)
+    def build():
+        counts, edges = bin_counts(masked_values(archive.frame, [variable])[variable].to_numpy(), bins)
+        return pd.DataFrame({"left": edges[:-1], "right": edges[1:], "count": counts})
+    table = archive.cache.frame(f"bins-{variable}-{bins}", build)
+    return table["count"].to_numpy(), np.append(table["left"].to_numpy(), table["right"].to_numpy()[-1:])
@@ -0,0 +1,174 @@
+#Near-real-time tail of the logger feed: an append-only CSV file with a header row of
+#Timestamp plus the MET variable columns. Feed it from the synthetic generator with
+#(from the repository root):
+#    PYTHONPATH=project python -m met.live --simulate
+import argparse
+import io
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from met.data import VARIABLES, WIND_DIRECTION, WIND_SPEED
+from met.store import TIME_COLUMN
+from met.wind import vector_mean, wind_components
+
+
+LIVE_FEED_PATH = os.environ.get("NWFP_MET_LIVE", "project/live_feed.csv")
+
+#Readings kept in memory: one day of one-minute samples
+DEFAULT_CAPACITY = 24 * 60
+
+
+#Complete lines appended to the feed since the last read. A trailing partial line is
+#left for the next read, and a file that shrank (rotated or truncated) is read afresh.
+class FeedTail:
+    def __init__(self, path=LIVE_FEED_PATH):
+        self.path = path
+        self.offset = 0
+        self.header = None
+
+    def read(self):
+        if not os.path.exists(self.path):
+            return None
+        if os.path.getsize(self.path) < self.offset:
+            self.offset, self.header = 0, None
+        with open(self.path, "rb") as file:
+            file.seek(self.offset)
+            chunk = file.read()
+        end = chunk.rfind(b"\n") + 1
+        if not end:
+            return None
+        self.offset += end
+        lines = chunk[:end].decode("utf-8")
+        if self.header is None:
+            header, _, lines = lines.partition("\n")
+            self.header = header.strip().split(",")
+        if not lines.strip():
+            return None
+        batch = pd.read_csv(io.StringIO(lines), names=self.header, parse_dates=[TIME_COLUMN], index_col=TIME_COLUMN)
+        return batch.reindex(columns=list(VARIABLES))
+
+
+#Fixed-capacity buffer of the latest readings in preallocated arrays. append() returns
+#the rows it overwrote so running statistics can take them back out.
+class RingBuffer:
+    def __init__(self, capacity=DEFAULT_CAPACITY, columns=VARIABLES):
+        self.capacity = capacity
+        self.columns = tuple(columns)
+        self.times = np.zeros(capacity, dtype="datetime64[ns]")
+        self.values = np.full((capacity, len(self.columns)), np.nan)
+        self.head = 0
+        self.size = 0
+
+    def append(self, times, values):
+        if len(times) >= self.capacity:
+            evicted = self.values[self._order()].copy()
+            times, values = times[-self.capacity:], values[-self.capacity:]
+            self.head, self.size = 0, 0
+        positions = (self.head + np.arange(len(times))) % self.capacity
+        if len(times) < self.capacity:
+            evicted = self.values[positions[self.capacity - self.size:]].copy()
+        self.times[positions] = times
+        self.values[positions] = values
+        self.head = (self.head + len(times)) % self.capacity
+        self.size = min(self.capacity, self.size + len(times))
+        return evicted
+
+    def _order(self):
+        return (self.head - self.size + np.arange(self.size)) % self.capacity
+
+    def frame(self):
+        order = self._order()
+        return pd.DataFrame(self.values[order], index=pd.DatetimeIndex(self.times[order]), columns=list(self.columns))
+
+
+#Sums and valid-sample counts over the buffer, updated by adding the new rows and
+#subtracting the evicted ones instead of recomputing over the whole window
+class RollingStats:
+    def __init__(self, width):
+        self.sums = np.zeros(width)
+        self.counts = np.zeros(width, dtype=np.int64)
+
+    def add(self, values, sign=1):
+        if len(values):
+            self.sums += sign * np.nansum(values, axis=0)
+            self.counts += sign * np.count_nonzero(~np.isnan(values), axis=0)
+
+    def remove(self, values):
+        self.add(values, sign=-1)
+
+    def means(self):
+        return np.where(self.counts > 0, self.sums / np.maximum(self.counts, 1), np.nan)
+
+
+#One tail, buffer and set of rolling statistics shared by every session watching the live page.
+#The statistics carry the wind u/v components after the buffer columns, so the mean
+#direction is a vector mean rather than an arithmetic mean of angles.
+class LiveMonitor:
+    def __init__(self, path=LIVE_FEED_PATH, capacity=DEFAULT_CAPACITY):
+        self.tail = FeedTail(path)
+        self.buffer = RingBuffer(capacity)
+        self.stats = RollingStats(len(self.buffer.columns) + 2)
+        self._lock = threading.Lock()
+
+    def _with_components(self, values):
+        direction = values[:, self.buffer.columns.index(WIND_DIRECTION)]
+        speed = values[:, self.buffer.columns.index(WIND_SPEED)]
+        return np.column_stack((values,) + wind_components(direction, speed))
+
+    #Pulling any new lines into the buffer; returns whether anything arrived
+    def poll(self):
+        with self._lock:
+            batch = self.tail.read()
+            if batch is None or not len(batch):
+                return False
+            values = batch.to_numpy(dtype=np.float64)
+            evicted = self.buffer.append(batch.index.to_numpy(dtype="datetime64[ns]"), values)
+            self.stats.remove(self._with_components(evicted))
+            self.stats.add(self._with_components(values[-self.buffer.capacity:]))
+            return True
+
+    def recent(self):
+        with self._lock:
+            return self.buffer.frame()
+
+    def rolling_means(self):
+        with self._lock:
+            width = len(self.buffer.columns)
+            means = pd.Series(self.stats.means()[:width], index=list(self.buffer.columns))
+            direction, _ = vector_mean(self.stats.sums[width], self.stats.sums[width + 1], self.stats.counts[width])
+            means[WIND_DIRECTION] = float(direction)
+            return means
+
+
+@st.cache_resource(show_spinner=False)
+def load_monitor(path=LIVE_FEED_PATH):
+    return LiveMonitor(path)
+
+
+#Appending one synthetic reading per `interval` seconds to the feed, stamped with the current time
+def simulate(path=LIVE_FEED_PATH, interval=1.0, freq="1min"):
+    from met.synthetic import generate
+
+    readings = generate(years=1, start_year=pd.Timestamp.now().year, freq=freq)[list(VARIABLES)]
+    if not os.path.exists(path):
+        with open(path, "w") as file:
+            file.write(",".join((TIME_COLUMN,) + VARIABLES) + "\n")
+    for _, row in readings.iterrows():
+        with open(path, "a") as file:
+            file.write(",".join([pd.Timestamp.now().isoformat()] + ["" if np.isnan(value) else f"{value:.2f}" for value in row]) + "\n")
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live MET feed utilities.")
+    parser.add_argument("--simulate", action="store_true", help="append synthetic readings to the feed")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between simulated readings")
+    parser.add_argument("--path", default=LIVE_FEED_PATH)
+    args = parser.parse_args()
+    if args.simulate:
+        simulate(args.path, args.interval)
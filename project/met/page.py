@@ -0,0 +1,211 @@
+#Page engine shared by the variable pages: summary statistics, statistical graphs, the
+#yearly range and the year -> month -> day drill-down of one variable. Every page reads
+#the same per-station archive, so a second page reuses the aggregates built for the first.
+#Each interactive section is a fragment: changing one of its widgets reruns only that
+#section, so e.g. picking a day does not redraw the graphs or the yearly range.
+import plotly.graph_objects as go
+import streamlit as st
+
+from met.archive import current_archive
+from met.data import AIR_TEMPERATURE, PRECIPITATION, RELATIVE_HUMIDITY, WIND_SPEED, select_station
+from met.downsample import downsample
+from met.partition import MONTH_NUMBERS
+from met.profiling import image, plotly_chart, profile_panel
+from met.render import load_figure_cache
+from met.wind import direction_figure, load_rose, rose_figure
+
+
+SIDEBAR_STYLE = """
+    <style>
+        /* Reduce sidebar width */
+        [data-testid="stSidebar"] {
+            width: 240px !important;
+            min-width: 240px !important;
+        }
+    </style>
+    """
+
+#Per drill-down rule: the adjective of its charts, the unit of its extremes and how the
+#time of an extreme is shown
+DRILL_DOWN = {
+    "ME": ("Monthly", "Month", lambda moment: moment.month_name()),
+    "D": ("Daily", "Day", lambda moment: moment.day),
+    "h": ("Hourly", "Hour", lambda moment: moment.hour),
+}
+
+
+#What differs between the variable pages. `aggregate` is "mean" or "sum" and picks the
+#summary metrics, the headings and the downsampling of raw measurements; `companions`
+#are offered for a second y-axis in the drill-down; `rose` adds the wind direction charts.
+class VariableSpec:
+    def __init__(self, column, title, name, label=None, aggregate="mean", companions=(), color="dodgerblue",
+                 rose=False):
+        self.column = column
+        self.title = title
+        self.name = name
+        self.label = label or name
+        self.aggregate = aggregate
+        self.companions = tuple(companions)
+        self.color = color
+        self.rose = rose
+
+    @property
+    def totals(self):
+        return self.aggregate == "sum"
+
+    @property
+    def heading(self):
+        return "Totals" if self.totals else "Averages"
+
+    @property
+    def downsample_mode(self):
+        return "minmax" if self.totals else "lttb"
+
+
+AIR_TEMPERATURE_PAGE = VariableSpec(AIR_TEMPERATURE, "Air Temperature", "Air Temperature", label="Temperature",
+                                    companions=(RELATIVE_HUMIDITY, WIND_SPEED))
+RELATIVE_HUMIDITY_PAGE = VariableSpec(RELATIVE_HUMIDITY, "Relative Humidity", "Relative Humidity",
+                                      companions=(AIR_TEMPERATURE, WIND_SPEED))
+WIND_PAGE = VariableSpec(WIND_SPEED, "Wind Speed/Direction", "Wind Speed",
+                         companions=(AIR_TEMPERATURE, RELATIVE_HUMIDITY), rose=True)
+PRECIPITATION_PAGE = VariableSpec(PRECIPITATION, "Precipitation", "Precipitation", aggregate="sum",
+                                  color="CornflowerBlue")
+
+
+def summary_section(spec, archive):
+    st.header("Summary Statistics")
+    summary = archive.stats.summary.loc[spec.column]
+    if spec.totals:
+        col1, col2 = st.columns(2)
+        col1.metric(f"Total {spec.name}:", f"{summary['sum']:.2f}")
+        return
+    col1, col2, col3 = st.columns(3)
+    col1.metric(f"Average {spec.name}:", f"{summary['mean']:.2f}")
+    col2.metric(f"Maximum {spec.name}:", f"{summary['max']:.2f}")
+    col3.metric(f"Minimum {spec.name}:", f"{summary['min']:.2f}")
+
+
+@st.fragment
+def graphs_section(spec, archive):
+    figures = load_figure_cache()
+    options = ["Histogram", "Box-Plot"] + (["Rose Plot"] if spec.rose else [])
+    selected_graphs = st.multiselect("Select statistical graphs to display: (Optional)", options, default=["Histogram"])
+    col1, col2, col3 = st.columns(3)
+    if "Histogram" in selected_graphs:
+        with col1:
+            image(figures.histogram(spec.column, bins=40, station=archive.station, version=archive.version),
+                  width="stretch")
+    if "Box-Plot" in selected_graphs:
+        with col2:
+            image(figures.boxplot(spec.column, station=archive.station, version=archive.version),
+                  width="stretch")
+    if "Rose Plot" in selected_graphs:
+        with col3:
+            plotly_chart(rose_figure(load_rose(station=archive.station, version=archive.version), height=350),
+                         key="rose")
+
+
+#Yearly values of the selected years, or the raw measurements reduced to the point budget
+@st.fragment
+def yearly_section(spec, archive):
+    yearly_data = archive.cube.level("YE")
+    first_year, last_year = int(yearly_data.index.year.min()), int(yearly_data.index.year.max())
+    #A slider needs two distinct ends, so a record within one year has no range to pick
+    if first_year < last_year:
+        start_year, end_year = st.slider("Select Year Range: (Optional)", min_value=first_year, max_value=last_year,
+                                         value=(first_year, last_year), step=1)
+    else:
+        start_year, end_year = first_year, last_year
+    if st.checkbox("Show raw measurements for the selected years", key="raw"):
+        series = downsample(archive.frame[spec.column].loc[f"{start_year}":f"{end_year}"], mode=spec.downsample_mode)
+        st.subheader(f"Raw Measurements ({start_year} - {end_year})")
+    else:
+        series = yearly_data[spec.column].loc[f"{start_year}":f"{end_year}"]
+        st.subheader(f"Yearly {spec.heading} ({start_year} - {end_year})")
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=series.index, y=series, mode="lines" if len(series) > 1 else "markers",
+                             line=dict(color="CornflowerBlue")))
+    fig.update_layout(margin=dict(t=0, b=0, l=0, r=0), height=300)
+    plotly_chart(fig, key="yearly")
+
+
+#Line of the variable over a drill-down period, with an optional companion on a second y-axis
+def period_figure(spec, data, companion=None):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=data.index, y=data[spec.column], mode="lines", name=spec.column,
+                             line=dict(color=spec.color)))
+    fig.update_layout(margin=dict(t=0, b=0, l=0, r=0), height=300)
+    if companion:
+        fig.add_trace(go.Scatter(x=data.index, y=data[companion], mode="lines", name=companion,
+                                 line=dict(color="Coral"), yaxis="y2"))
+        fig.update_layout(
+            yaxis_title=spec.column,
+            yaxis2=dict(title=companion, overlaying="y", side="right"),
+            legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5))
+    return fig
+
+
+#Extremes, chart and (for wind) direction charts of one year, month or day. `period` is
+#(year,), (year, month) or (year, month, day) and `when` the phrase used in the headings.
+def period_view(spec, archive, rule, period, when, companion=None):
+    adjective, unit, moment = DRILL_DOWN[rule]
+    data = archive.cube.period(rule, *period)
+    st.subheader(f"Summary statistics {when}")
+    extremes = archive.stats.extremes(rule, spec.column, *period)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(label=f"Max {spec.label}:", value=f"{extremes['max']:.2f}")
+    col2.metric(label=f"{unit} with Max {spec.label}:", value=f"{moment(extremes['argmax'])}")
+    if not spec.totals:
+        col3.metric(label=f"Min {spec.label}:", value=f"{extremes['min']:.2f}")
+        col4.metric(label=f"{unit} with Min {spec.label}:", value=f"{moment(extremes['argmin'])}")
+    st.subheader(f"{adjective} {spec.heading} {when}")
+    plotly_chart(period_figure(spec, data, companion), key=f"{rule}-line")
+    if spec.rose:
+        st.subheader(f"{adjective} Wind Directions {when}")
+        plotly_chart(direction_figure(data), key=f"{rule}-directions")
+        st.subheader(f"Wind Rose {when}")
+        plotly_chart(rose_figure(load_rose(*period, station=archive.station, version=archive.version)),
+                     key=f"{rule}-rose")
+
+
+#Fragments cannot write to the sidebar, so the drill-down selectors sit in a row above
+#the views they control
+@st.fragment
+def seasonal_section(spec, archive):
+    partitions = archive.partitions
+    st.header("Select for Seasonal View")
+    col1, col2, col3, col4 = st.columns(4)
+    selected_year = col1.selectbox("Select Year: (Optional)", [None] + partitions.years(), key="year")
+    months = partitions.month_names(selected_year) if selected_year else []
+    selected_month = col2.selectbox("Select Month: (Optional)", [None] + months, key="month", disabled=not months)
+    days = partitions.days(selected_year, MONTH_NUMBERS[selected_month]) if selected_month in months else []
+    selected_day = col3.selectbox("Select Day: (Optional)", [None] + days, key="day", disabled=not days)
+    companion = None
+    if spec.companions:
+        companion = col4.radio(f"Select another variable to compare with {spec.name}: (Optional)",
+                               options=[None] + list(spec.companions), key="compare")
+    if not selected_year:
+        return
+    st.header(f"Seasonal {spec.heading}")
+    period_view(spec, archive, "ME", (selected_year,), f"in {selected_year}", companion)
+    if selected_month not in months:
+        return
+    month = MONTH_NUMBERS[selected_month]
+    period_view(spec, archive, "D", (selected_year, month), f"in {selected_month} {selected_year}", companion)
+    if selected_day not in days:
+        return
+    period_view(spec, archive, "h", (selected_year, month, selected_day),
+                f"on {selected_day} {selected_month} {selected_year}", companion)
+
+
+def render_variable_page(spec):
+    st.set_page_config(layout="wide")
+    st.title(spec.title)
+    st.markdown(SIDEBAR_STYLE, unsafe_allow_html=True)
+    #Shared, process-wide frame and aggregates of the selected station, with any newly ingested records
+    archive = current_archive(select_station())
+    summary_section(spec, archive)
+    graphs_section(spec, archive)
+    yearly_section(spec, archive)
+    seasonal_section(spec, archive)
+    profile_panel()
@@ -0,0 +1,85 @@
+#Year -> month -> day partitions of a sorted DatetimeIndex
+import calendar
+
+import numpy as np
+import pandas as pd
+
+
+MONTH_NUMBERS = {name: number for number, name in enumerate(calendar.month_name) if name}
+
+
+#Start of a calendar year, month or day and the start of the next one. The end is
+#exclusive, so the bounds compare cleanly against an index of any time resolution.
+def period_bounds(year, month=None, day=None):
+    start = pd.Timestamp(year=int(year), month=int(month or 1), day=int(day or 1))
+    if day:
+        end = start + pd.offsets.Day()
+    elif month:
+        end = start + pd.offsets.MonthBegin()
+    else:
+        end = start + pd.offsets.YearBegin()
+    return start, end
+
+
+#Row positions [start, stop) of the timestamps in [start, end), found with two binary
+#searches on the sorted index
+def locate(index, start, end):
+    return int(index.searchsorted(start, side="left")), int(index.searchsorted(end, side="left"))
+
+
+#Rows of a time-sorted frame falling in a calendar year, month or day, as a positional slice
+def slice_period(frame, year, month=None, day=None):
+    start, stop = locate(frame.index, *period_bounds(year, month, day))
+    return frame.iloc[start:stop]
+
+
+class PartitionIndex:
+    #Row ranges of the days in index[start:], which must begin on a day boundary, added to
+    #`days` (the ranges of the rows before it)
+    def __init__(self, index, start=0, days=None):
+        self.index = index
+        self._days = {} if days is None else days
+        normalized = index[start:].normalize()
+        if len(normalized):
+            starts = np.flatnonzero(np.r_[True, normalized[1:] != normalized[:-1]])
+        else:
+            starts = np.array([], dtype=np.int64)
+        stops = np.r_[starts[1:], len(normalized)].astype(np.int64)
+        first_days = normalized[starts]
+        for year, month, day, first, stop in zip(first_days.year, first_days.month, first_days.day, starts, stops):
+            self._days.setdefault(int(year), {}).setdefault(int(month), {})[int(day)] = (int(first) + start,
+                                                                                         int(stop) + start)
+
+    #Index of the frame after rows from `first` (the earliest new timestamp) on were merged
+    #into it: days before that keep their row ranges and only later ones are found again
+    def extended(self, index, first):
+        first = pd.Timestamp(first).normalize()
+        kept = {}
+        for year, months in self._days.items():
+            for month, days in months.items():
+                for day, rows in days.items():
+                    if (year, month, day) < (first.year, first.month, first.day):
+                        kept.setdefault(year, {}).setdefault(month, {})[day] = rows
+        return PartitionIndex(index, int(index.searchsorted(first, side="left")), kept)
+
+    def years(self):
+        return list(self._days)
+
+    def months(self, year):
+        return list(self._days.get(int(year), {}))
+
+    def month_names(self, year):
+        return [calendar.month_name[month] for month in self.months(year)]
+
+    def days(self, year, month):
+        return list(self._days.get(int(year), {}).get(int(month), {}))
+
+    #Row offsets [start, stop) of a year, month or day in the indexed frame
+    def rows(self, year, month=None, day=None):
+        if day is not None:
+            return self._days.get(int(year), {}).get(int(month), {}).get(int(day), (0, 0))
+        return locate(self.index, *period_bounds(year, month))
+
+    def slice(self, frame, year, month=None, day=None):
+        start, stop = self.rows(year, month, day)
+        return frame.iloc[start:stop]
@@ -0,0 +1,133 @@
+#On-disk cache of derived artifacts (aggregates, statistics, histogram and wind rose
+#counts) that survives restarts. Entries live under a directory named after a hash of
+#the source data, so a changed source or store manifest never serves stale results.
+import functools
+import hashlib
+import logging
+import os
+import re
+import shutil
+import weakref
+from urllib.parse import quote
+
+import pandas as pd
+
+from met.data import DATA_PATH
+from met.profiling import timed
+from met.quality import EXCLUDED_FLAGS
+from met.store import manifest_path, store_exists
+
+
+CACHE_PATH = os.environ.get("NWFP_MET_CACHE", "project/.met_cache")
+
+#Bumped whenever the layout of a cached artifact changes
+CACHE_FORMAT = 2
+
+#Names of the fingerprint directories; nothing else under the cache root is ever pruned
+FINGERPRINT_PATTERN = re.compile(r"[0-9a-f]{16}")
+
+#Joins the levels of MultiIndex column labels, which parquet cannot store as such
+COLUMN_SEPARATOR = "\x1f"
+
+logger = logging.getLogger(__name__)
+
+#Caches alive in this process. An archive that has not been refreshed since the last
+#drop still uses its old fingerprint, so those directories are never pruned.
+_live_caches = weakref.WeakSet()
+
+
+@functools.lru_cache(maxsize=8)
+def _file_digest(path, size, mtime_ns):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+#Content hash of the store manifest (or of the single parquet file) together with the
+#settings that shape the artifacts; None when there is no source to fingerprint
+def source_fingerprint():
+    source = manifest_path() if store_exists() else DATA_PATH
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+    digest = hashlib.sha256(_file_digest(source, stat.st_size, stat.st_mtime_ns).encode())
+    digest.update(repr((CACHE_FORMAT, EXCLUDED_FLAGS)).encode())
+    return digest.hexdigest()[:16]
+
+
+def _flatten(frame):
+    if isinstance(frame.columns, pd.MultiIndex):
+        frame = frame.set_axis([COLUMN_SEPARATOR.join(map(str, label)) for label in frame.columns], axis=1)
+    return frame
+
+
+def _unflatten(frame):
+    if len(frame.columns) and all(COLUMN_SEPARATOR in column for column in frame.columns):
+        frame.columns = pd.MultiIndex.from_tuples([tuple(column.split(COLUMN_SEPARATOR)) for column in frame.columns])
+    return frame
+
+
+#Parquet files of one station's artifacts. Files are only read when asked for, and
+#write failures (e.g. a read-only container filesystem) just leave the cache cold.
+class PersistentCache:
+    def __init__(self, fingerprint, station, root=CACHE_PATH):
+        self.root = root
+        self.fingerprint = fingerprint
+        self.directory = os.path.join(root, fingerprint, quote(str(station), safe="")) if fingerprint else None
+        _live_caches.add(self)
+
+    def path(self, name):
+        return os.path.join(self.directory, f"{quote(name, safe='')}.parquet")
+
+    def load(self, name):
+        if self.directory is None or not os.path.exists(self.path(name)):
+            return None
+        with timed("cache read", artifact=name):
+            return _unflatten(pd.read_parquet(self.path(name)))
+
+    def save(self, name, frame):
+        if self.directory is None:
+            return
+        try:
+            if not os.path.isdir(self.directory):
+                self._prune()
+                os.makedirs(self.directory, exist_ok=True)
+            temporary = self.path(name) + ".tmp"
+            _flatten(frame).to_parquet(temporary)
+            os.replace(temporary, self.path(name))
+        except (OSError, ValueError) as error:
+            logger.warning("Could not persist %s: %s", name, error)
+
+    def save_all(self, frames):
+        for name, frame in frames.items():
+            self.save(name, frame)
+
+    def frame(self, name, build):
+        frame = self.load(name)
+        if frame is None:
+            frame = build()
+            self.save(name, frame)
+        return frame
+
+    #All of `names` from disk, or a fresh build of all of them when any is missing
+    def frames(self, names, build):
+        frames = {name: self.load(name) for name in names}
+        if any(frame is None for frame in frames.values()):
+            frames = build()
+            self.save_all(frames)
+        return frames
+
+    #Artifacts of earlier source versions are removed once a new version is first written,
+    #except those of fingerprints a live cache of this process still uses. Only directories
+    #named like a fingerprint are touched, so a cache root shared with other data is safe.
+    def _prune(self):
+        if not os.path.isdir(self.root):
+            return
+        in_use = {cache.fingerprint for cache in list(_live_caches) if cache.root == self.root}
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name not in in_use and FINGERPRINT_PATTERN.fullmatch(name) and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
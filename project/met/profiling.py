@@ -0,0 +1,104 @@
+#Timings and payload sizes of the data loads, aggregations and charts of a rerun.
+#Records are kept per session for the debug panel and, when NWFP_MET_PROFILE_LOG is
+#set, appended to that file as one JSON object per line.
+import contextlib
+import json
+import logging
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+
+
+#Shows the debug panel on every page; a single page can also be opened with ?debug=1
+PROFILE_ENABLED = os.environ.get("NWFP_MET_PROFILE", "") not in ("", "0")
+
+PROFILE_LOG = os.environ.get("NWFP_MET_PROFILE_LOG")
+
+RECORDS_KEY = "_profile_records"
+
+logger = logging.getLogger(__name__)
+if PROFILE_LOG:
+    _handler = logging.FileHandler(PROFILE_LOG)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _context():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    return get_script_run_ctx()
+
+
+#Whether the current session shows the debug panel; always False outside a script run
+def enabled():
+    if _context() is None:
+        return False
+    return PROFILE_ENABLED or st.query_params.get("debug") not in (None, "", "0")
+
+
+#Records are collected only when someone will look at them
+def active():
+    return bool(PROFILE_LOG) or enabled()
+
+
+def record(entry):
+    context = _context()
+    entry = {"time": time.time(), "session": getattr(context, "session_id", None), **entry}
+    if PROFILE_LOG:
+        logger.info(json.dumps(entry, default=str))
+    if context is not None and enabled():
+        st.session_state.setdefault(RECORDS_KEY, []).append(entry)
+
+
+#Times the enclosed block (or the decorated function) as one section of the rerun. The
+#yielded dict is part of the record, so callers can add e.g. rows or bytes to it.
+@contextlib.contextmanager
+def timed(section, **fields):
+    entry = {"section": section, **fields}
+    start = time.perf_counter()
+    try:
+        yield entry
+    finally:
+        entry["seconds"] = time.perf_counter() - start
+        if active():
+            record(entry)
+
+
+#Plotly chart with its serialized size recorded; the figure is only serialized a second
+#time when profiling is active
+def plotly_chart(fig, **kwargs):
+    with timed("chart", key=kwargs.get("key")) as entry:
+        if active():
+            entry["bytes"] = len(fig.to_json())
+        st.plotly_chart(fig, **kwargs)
+
+
+def image(data, **kwargs):
+    with timed("image") as entry:
+        entry["bytes"] = len(data) if isinstance(data, bytes) else None
+        st.image(data, **kwargs)
+
+
+def frame_bytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+#Sidebar table of the sections recorded since the panel was last drawn, with an export
+#of the same records as JSON lines. Called at the end of a page.
+def profile_panel():
+    if not enabled():
+        return
+    records = st.session_state.pop(RECORDS_KEY, [])
+    with st.sidebar.expander("Profiling", expanded=True):
+        if not records:
+            st.caption("Nothing recorded in this rerun.")
+            return
+        table = pd.DataFrame(records).drop(columns=["time", "session"])
+        st.metric("Recorded seconds", f"{table['seconds'].sum():.3f}")
+        st.dataframe(table.sort_values("seconds", ascending=False), hide_index=True)
+        st.download_button("Export JSON lines", "\n".join(json.dumps(entry, default=str) for entry in records),
+                           file_name="profile.jsonl", mime="application/json")
@@ -0,0 +1,33 @@
+#Masking of flagged samples before anything is aggregated
+import os
+
+import numpy as np
+import pandas as pd
+
+
+#Flags whose samples are left out of every aggregate, histogram and statistic.
+#Override with a comma-separated list, e.g. NWFP_MET_EXCLUDED_FLAGS="Suspect,Missing,Poor"
+EXCLUDED_FLAGS = tuple(flag.strip() for flag in os.environ.get("NWFP_MET_EXCLUDED_FLAGS", "Suspect,Missing").split(",") if flag.strip())
+
+
+def quality_column(variable):
+    return f"{variable} Quality"
+
+
+#True for the samples of a variable whose flag is accepted. Categorical flags are
+#compared through their small integer codes, so each column is scanned once.
+def quality_mask(frame, variable, excluded=EXCLUDED_FLAGS):
+    column = quality_column(variable)
+    if column not in frame.columns or not excluded:
+        return np.ones(len(frame), dtype=bool)
+    flags = frame[column]
+    if isinstance(flags.dtype, pd.CategoricalDtype):
+        codes = flags.cat.categories.get_indexer(list(excluded))
+        return ~np.isin(flags.cat.codes.to_numpy(), codes[codes >= 0])
+    return ~flags.isin(excluded).to_numpy()
+
+
+#Measurements as float64 with the samples of excluded flags set to NaN
+def masked_values(frame, variables, excluded=EXCLUDED_FLAGS):
+    return pd.DataFrame({variable: np.where(quality_mask(frame, variable, excluded), frame[variable].to_numpy(dtype=np.float64), np.nan)
+                         for variable in variables}, index=frame.index)
@@ -0,0 +1,147 @@
+#Aggregates over arbitrary date ranges without touching raw rows. Prefix sums of the
+#cube's hourly sums and counts answer any bucket's mean or total in O(1), and sparse
+#tables over the hourly maxima and minima answer its extremes in O(1) after an
+#O(n log n) build, so a window of any length costs the same.
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from met.aggregates import finalize
+from met.archive import load_archive
+from met.data import VARIABLES, WIND_DIRECTION
+from met.profiling import timed
+from met.quality import EXCLUDED_FLAGS, masked_values
+
+
+#Bucket sizes offered by the explorer, as pandas frequencies of the bucket starts
+FREQUENCIES = {
+    "Hourly": "h",
+    "Daily": "D",
+    "Weekly": "W-MON",
+    "Monthly": "MS",
+    "Quarterly": "QS",
+    "Yearly": "YS",
+}
+
+#Variables with meaningful extremes; a minimum of directions in degrees is not one
+EXTREME_VARIABLES = tuple(variable for variable in VARIABLES if variable != WIND_DIRECTION)
+
+HOURLY_EXTREMES = ("hourly-max", "hourly-min")
+
+
+def max_column(variable):
+    return f"{variable} Max"
+
+
+def min_column(variable):
+    return f"{variable} Min"
+
+
+#Hourly maxima and minima of the valid samples, on the same hourly grid as the cube
+def hourly_extremes(df, variables=EXTREME_VARIABLES, excluded=EXCLUDED_FLAGS):
+    hourly = masked_values(df, variables, excluded).resample("h")
+    return {"hourly-max": hourly.max(), "hourly-min": hourly.min()}
+
+
+#Range maximum (np.fmax) or minimum (np.fmin) queries; NaN values are ignored and an
+#empty range gives NaN. Level k holds the reduction of every run of 2**k values.
+class SparseTable:
+    def __init__(self, values, reduce):
+        self.reduce = reduce
+        self.levels = [np.asarray(values, dtype=np.float32)]
+        span = 1
+        while 2 * span <= len(self.levels[0]):
+            previous = self.levels[-1]
+            self.levels.append(reduce(previous[:-span], previous[span:]))
+            span *= 2
+
+    #Reductions over the half-open ranges [starts, stops), two overlapping runs each
+    def query(self, starts, stops):
+        starts, stops = np.asarray(starts, dtype=np.int64), np.asarray(stops, dtype=np.int64)
+        lengths = stops - starts
+        result = np.full(len(starts), np.nan)
+        valid = lengths > 0
+        levels = np.zeros(len(starts), dtype=np.int64)
+        levels[valid] = np.log2(lengths[valid]).astype(np.int64)
+        for level in np.unique(levels[valid]):
+            selected = valid & (levels == level)
+            table = self.levels[level]
+            result[selected] = self.reduce(table[starts[selected]], table[stops[selected] - (1 << level)])
+        return result
+
+
+#Bucket edges covering start to end (both inclusive, to the hour): the first and last
+#buckets are clipped to the window, the ones in between start on the frequency. Without
+#a frequency the window is a single bucket.
+def bucket_edges(start, end, freq=None):
+    start, end = pd.Timestamp(start).floor("h"), pd.Timestamp(end).floor("h") + pd.Timedelta(hours=1)
+    if freq is None:
+        return pd.DatetimeIndex([start, end])
+    inner = pd.date_range(start, end, freq=freq)
+    inner = inner[(inner > start) & (inner < end)]
+    return pd.DatetimeIndex([start]).append(inner).append(pd.DatetimeIndex([end]))
+
+
+class PrefixIndex:
+    def __init__(self, sums, counts, maxima, minima, interval):
+        self.index = sums.index
+        self.columns = sums.columns
+        self.interval = interval
+        self._sums = np.vstack([np.zeros((1, sums.shape[1])), np.cumsum(sums.to_numpy(dtype=np.float64), axis=0)])
+        self._counts = np.vstack([np.zeros((1, counts.shape[1]), dtype=np.int64),
+                                  np.cumsum(counts.to_numpy(dtype=np.int64), axis=0)])
+        self._maxima = maxima.reindex(self.index)
+        self._minima = minima.reindex(self.index)
+        self._tables = {}
+
+    @property
+    def start(self):
+        return self.index[0]
+
+    @property
+    def end(self):
+        return self.index[-1]
+
+    #Tables are built on the first query of a variable; a concurrent first query only
+    #builds the same table twice
+    def _table(self, variable, kind):
+        table = self._tables.get((variable, kind))
+        if table is None:
+            if kind == "max":
+                table = SparseTable(self._maxima[variable].to_numpy(), np.fmax)
+            else:
+                table = SparseTable(self._minima[variable].to_numpy(), np.fmin)
+            self._tables[(variable, kind)] = table
+        return table
+
+    #Finalized aggregates (means or totals, counts, coverage, wind vector means) of the
+    #buckets of `freq` between start and end, plus the maximum and minimum of each
+    #variable with extremes
+    def window(self, start, end, freq="D"):
+        with timed("range query", freq=freq) as entry:
+            edges = bucket_edges(start, end, freq)
+            positions = self.index.searchsorted(edges)
+            starts, stops = positions[:-1], positions[1:]
+            sums = pd.DataFrame(self._sums[stops] - self._sums[starts], index=edges[:-1], columns=self.columns)
+            counts = pd.DataFrame(self._counts[stops] - self._counts[starts], index=edges[:-1], columns=self.columns)
+            frame = finalize(sums, counts, interval=self.interval, durations=edges[1:] - edges[:-1])
+            for variable in self._maxima.columns:
+                frame[max_column(variable)] = self._table(variable, "max").query(starts, stops)
+                frame[min_column(variable)] = self._table(variable, "min").query(starts, stops)
+            entry["buckets"] = len(frame)
+        return frame
+
+    #The whole window as a single bucket
+    def total(self, start, end):
+        return self.window(start, end, freq=None).iloc[0]
+
+
+#Index of a station's archive at one version; the hourly extremes are kept in the
+#persistent cache next to the cube
+@st.cache_resource(show_spinner="Indexing the record...", max_entries=4)
+def load_prefix_index(station, version=0):
+    archive = load_archive(station)
+    with timed("prefix index", station=station):
+        sums, counts = archive.cube.hourly()
+        extremes = archive.cache.frames(HOURLY_EXTREMES, lambda: hourly_extremes(archive.frame))
+        return PrefixIndex(sums, counts, extremes["hourly-max"], extremes["hourly-min"], archive.cube.interval)
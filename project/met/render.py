@@ -0,0 +1,131 @@
+#Rendered images of the static summary plots, shared by every session
+import io
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from met.archive import load_archive
+from met.histograms import load_bin_counts
+from met.profiling import timed
+
+
+#Upper bound on the bytes of PNG data kept in memory
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+#Matplotlib style used for each Streamlit theme
+THEME_STYLES = {"light": "default", "dark": "dark_background"}
+
+PLOT_COLOR = "CornflowerBlue"
+
+#matplotlib.style.context changes the process-wide rcParams for as long as it is open
+_style_lock = threading.Lock()
+
+
+def current_theme():
+    return st.get_option("theme.base") or "light"
+
+
+#Short display name of a column, e.g. "Air Temperature" for "Air Temperature (°C)"
+def display_name(variable):
+    return variable.split(" (")[0]
+
+
+#Least recently used entries are evicted once the stored images exceed max_bytes
+class FigureCache:
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        with self._lock:
+            if key in self._images:
+                self.size -= len(self._images.pop(key))
+            self._images[key] = image
+            self.size += len(image)
+            while self.size > self.max_bytes and len(self._images) > 1:
+                _, evicted = self._images.popitem(last=False)
+                self.size -= len(evicted)
+
+    def get_or_render(self, key, render):
+        image = self.get(key)
+        if image is None:
+            image = render()
+            self.put(key, image)
+        return image
+
+    #Images are keyed by station and archive version as well, so an ingested drop of
+    #records renders fresh images while the stale ones age out of the LRU
+    def histogram(self, variable, bins=40, theme=None, station=None, version=0):
+        theme = theme or current_theme()
+        return self.get_or_render((station, version, variable, "histogram", bins, theme),
+                                  lambda: render_histogram(variable, bins, theme, station, version))
+
+    def boxplot(self, variable, theme=None, station=None, version=0):
+        theme = theme or current_theme()
+        return self.get_or_render((station, version, variable, "boxplot", None, theme),
+                                  lambda: render_boxplot(variable, theme, station))
+
+
+#Drawing on a standalone Figure (not pyplot) avoids pyplot's global figure state, but the
+#theme style is applied through the global rcParams, so renders are serialized: a session
+#drawing in one theme cannot pick up another session's colors. The data is loaded before
+#the lock is taken. matplotlib is only imported when an image is actually rendered.
+def _render(draw, theme, section="render"):
+    with timed(section, theme=theme) as entry:
+        import matplotlib.style
+        from matplotlib.figure import Figure
+
+        with _style_lock, matplotlib.style.context(THEME_STYLES.get(theme, "default")):
+            fig = Figure(figsize=(12, 6))
+            ax = fig.subplots()
+            draw(ax)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", bbox_inches="tight")
+        entry["bytes"] = buffer.tell()
+    return buffer.getvalue()
+
+
+#Bars drawn from the cached bin counts, so the raw column never reaches matplotlib
+def render_histogram(variable, bins, theme, station, version=0):
+    counts, edges = load_bin_counts(variable, bins, station, version)
+
+    def draw(ax):
+        ax.bar(edges[:-1], counts, width=edges[1:] - edges[:-1], align="edge", color=PLOT_COLOR, edgecolor="white")
+        ax.set_title(f"Histogram of {display_name(variable)}", fontsize=20)
+        ax.set_xlabel(variable, fontsize=18)
+        ax.set_ylabel("Density", fontsize=18)
+        ax.tick_params(axis="both", labelsize=16)
+    return _render(draw, theme, f"render histogram {variable}")
+
+
+#Box drawn from the precomputed quartiles and whiskers of the archive statistics
+def render_boxplot(variable, theme, station):
+    stats = load_archive(station).stats
+    box, outliers = stats.box(variable), stats.outliers(variable)
+
+    def draw(ax):
+        ax.bxp([box], orientation="horizontal", widths=0.8, patch_artist=True, showfliers=True,
+               boxprops=dict(facecolor=PLOT_COLOR), medianprops=dict(color="black"))
+        ax.set_yticks([])
+        ax.set_title(f"Box-Plot of {display_name(variable)}", fontsize=20)
+        if outliers > len(box["fliers"]):
+            ax.set_xlabel(f"{variable} ({len(box['fliers'])} of {outliers:,} outliers shown)", fontsize=18)
+        else:
+            ax.set_xlabel(variable, fontsize=18)
+        ax.tick_params(axis="both", labelsize=16)
+    return _render(draw, theme, f"render boxplot {variable}")
+
+
+@st.cache_resource(show_spinner=False)
+def load_figure_cache():
+    return FigureCache()
@@ -0,0 +1,161 @@
+#Summary metrics and drill-down extremes of every variable, computed once per archive version
+import numpy as np
+import pandas as pd
+
+from met.aggregates import bucket_start
+from met.data import VARIABLES
+from met.quality import EXCLUDED_FLAGS, masked_values
+
+
+#Grouping of each cube level for the drill-down: monthly values per year,
+#daily values per month and hourly values per day
+EXTREME_GROUPS = {
+    "ME": lambda index: [index.year.rename("year")],
+    "D": lambda index: [index.year.rename("year"), index.month.rename("month")],
+    "h": lambda index: [index.year.rename("year"), index.month.rename("month"), index.day.rename("day")],
+}
+
+#Outliers kept per variable for the box plot; beyond this an evenly spaced sample of the
+#sorted outliers is kept, which always includes the smallest and largest
+MAX_FLIERS = 200
+
+#Periods the rows of each extremes table cover, as cube resolutions
+EXTREME_PERIODS = {"ME": "YE", "D": "ME", "h": "D"}
+
+#Names of the frames the statistics are saved as in the persistent cache
+SUMMARY_FRAMES = ("summary", "fliers")
+EXTREME_FRAMES = tuple(f"extremes-{rule}" for rule in EXTREME_GROUPS)
+
+MISSING_EXTREMES = {"max": np.nan, "min": np.nan, "argmax": pd.NaT, "argmin": pd.NaT}
+
+
+#Sorted values outside the whiskers of each column, thinned to at most `limit` per variable,
+#as a long frame of (variable, value) rows
+def flier_sample(values, low, high, variables=VARIABLES, limit=MAX_FLIERS):
+    samples = []
+    for column, variable in enumerate(variables):
+        outside = np.sort(values[(values[:, column] < low[column]) | (values[:, column] > high[column]), column])
+        if len(outside) > limit:
+            outside = outside[np.linspace(0, len(outside) - 1, limit).round().astype(int)]
+        samples.append(pd.DataFrame({"variable": variable, "value": outside}))
+    return pd.concat(samples, ignore_index=True)
+
+
+#Mean, total, extremes, quartiles and 1.5 IQR whiskers of all variables in one pass
+#over the 2-D array of measurements, leaving out samples with excluded quality flags.
+#Returns the summary and a bounded sample of the outliers.
+def summary_statistics(frame, variables=VARIABLES, excluded=EXCLUDED_FLAGS):
+    values = masked_values(frame, variables, excluded).to_numpy()
+    counts = np.count_nonzero(~np.isnan(values), axis=0)
+    with np.errstate(invalid="ignore"):
+        sums = np.nansum(values, axis=0)
+        q1, median, q3 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0) if len(values) else np.full((3, len(variables)), np.nan)
+        low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        summary = pd.DataFrame({
+            "count": counts,
+            "sum": sums,
+            "mean": np.where(counts > 0, sums / np.maximum(counts, 1), np.nan),
+            "min": np.min(values, axis=0, initial=np.inf, where=~np.isnan(values)),
+            "max": np.max(values, axis=0, initial=-np.inf, where=~np.isnan(values)),
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "whislo": np.min(values, axis=0, initial=np.inf, where=values >= low),
+            "whishi": np.max(values, axis=0, initial=-np.inf, where=values <= high),
+            "outliers": np.count_nonzero((values < low) | (values > high), axis=0),
+        }, index=list(variables))
+        fliers = flier_sample(values, low, high, variables)
+    return summary.replace([np.inf, -np.inf], np.nan), fliers
+
+
+#Per period: the largest and smallest value at the next finer resolution and when they occurred
+def period_extremes(level, rule, variables=VARIABLES):
+    extremes = {}
+    for variable in variables:
+        series = level[variable].dropna()
+        grouped = series.groupby(EXTREME_GROUPS[rule](series.index))
+        extremes[variable] = pd.DataFrame({
+            "max": grouped.max(),
+            "min": grouped.min(),
+            "argmax": grouped.idxmax(),
+            "argmin": grouped.idxmin(),
+        })
+    return pd.concat(extremes, axis=1)
+
+
+def summary_frames(frame, variables=VARIABLES):
+    summary, fliers = summary_statistics(frame, variables)
+    return {"summary": summary, "fliers": fliers}
+
+
+def extreme_frames(cube, variables=VARIABLES):
+    return {f"extremes-{rule}": period_extremes(cube.level(rule), rule, variables) for rule in EXTREME_GROUPS}
+
+
+#Per-period extremes, kept current drop by drop from the cube, and the summary of the whole
+#record. The summary needs the quartiles of every sample, so after a drop it is only
+#computed again, by `summarize`, once something asks for it.
+class PeriodStatistics:
+    def __init__(self, extremes, summarize, variables=VARIABLES):
+        self.variables = variables
+        self._extremes = {rule: extremes[f"extremes-{rule}"] for rule in EXTREME_GROUPS}
+        self._summarize = summarize
+        self._summary = None
+        self._generation = 0
+
+    @property
+    def summary(self):
+        return self._summary_frames()["summary"]
+
+    @property
+    def fliers(self):
+        return self._summary_frames()["fliers"]
+
+    #A summary finished after a drop arrived is returned but not kept
+    def _summary_frames(self):
+        frames, generation = self._summary, self._generation
+        if frames is None:
+            frames = self._summarize()
+            if generation == self._generation:
+                self._summary = frames
+        return frames
+
+    #Extremes of the periods from the one holding `first` (the earliest new timestamp) on,
+    #taken from the updated cube; the summary is dropped until it is next asked for
+    def update(self, cube, first):
+        for rule in EXTREME_GROUPS:
+            level = cube.level(rule)
+            recomputed = period_extremes(level[level.index >= bucket_start(first, EXTREME_PERIODS[rule])], rule,
+                                         self.variables)
+            table = pd.concat([self._extremes[rule], recomputed])
+            self._extremes[rule] = table[~table.index.duplicated(keep="last")].sort_index()
+        self._summary = None
+        self._generation += 1
+
+    #The extremes, plus the summary when it is up to date
+    def to_frames(self):
+        frames = {f"extremes-{rule}": table for rule, table in self._extremes.items()}
+        frames.update(self._summary or {})
+        return frames
+
+    #Extremes of the monthly values in a year ("ME"), the daily values in a month ("D")
+    #or the hourly values in a day ("h")
+    def extremes(self, rule, variable, year, month=None, day=None):
+        key = tuple(int(part) for part in (year, month, day) if part is not None)
+        table = self._extremes[rule]
+        if table.index.nlevels == 1:
+            key = key[0]
+        if key not in table.index:
+            return dict(MISSING_EXTREMES)
+        return table.loc[key, variable].to_dict()
+
+    #Five-number summary and the sampled outliers in the form matplotlib's Axes.bxp expects
+    def box(self, variable):
+        row = self.summary.loc[variable]
+        return {"label": variable, "med": row["median"], "q1": row["q1"], "q3": row["q3"],
+                "whislo": row["whislo"], "whishi": row["whishi"],
+                "fliers": self.fliers.loc[self.fliers["variable"] == variable, "value"].to_numpy()}
+
+    #Number of values outside the whiskers, of which box() draws at most MAX_FLIERS
+    def outliers(self, variable):
+        return int(self.summary.loc[variable, "outliers"])
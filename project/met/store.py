@@ -0,0 +1,138 @@
+#Station- and year-partitioned parquet store of the MET data with one row group per month.
+#Files are only ever added, and each one is recorded in an append-only manifest.
+#Build the store from the single parquet file, or append a new drop of records, with
+#(from the repository root):
+#    PYTHONPATH=project python -m met.store [records.parquet]
+import json
+import os
+import sys
+from urllib.parse import quote, unquote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+STORE_PATH = os.environ.get("NWFP_MET_STORE", "project/met_store")
+TIME_COLUMN = "Timestamp"
+
+#The leading underscore keeps the manifest out of pyarrow's dataset discovery
+MANIFEST_NAME = "_manifest.json"
+
+#Hive partition keys, as directory names station=<name>/year=<year>
+PARTITIONING = ds.partitioning(pa.schema([("station", pa.string()), ("year", pa.int32())]), flavor="hive")
+
+
+def store_exists(root=STORE_PATH):
+    return os.path.isdir(root)
+
+
+def stored_stations(root=STORE_PATH):
+    return sorted(unquote(name.split("=", 1)[1]) for name in os.listdir(root) if name.startswith("station="))
+
+
+def partition_directory(root, station, year):
+    return os.path.join(root, f"station={quote(str(station), safe='')}", f"year={year}")
+
+
+def manifest_path(root=STORE_PATH):
+    return os.path.join(root, MANIFEST_NAME)
+
+
+#Entries in the order the files were written, each with a sequence number, the station,
+#the path relative to the store root and the first/last timestamp of the file
+def read_manifest(root=STORE_PATH):
+    if not os.path.exists(manifest_path(root)):
+        return []
+    with open(manifest_path(root)) as file:
+        return json.load(file)["entries"]
+
+
+def write_manifest(entries, root=STORE_PATH):
+    os.makedirs(root, exist_ok=True)
+    temporary = manifest_path(root) + ".tmp"
+    with open(temporary, "w") as file:
+        json.dump({"entries": entries}, file, indent=1)
+    os.replace(temporary, manifest_path(root))
+
+
+#Writing the rows of one station and year as a new file, each month as its own row
+#group so the min/max statistics of the timestamp column let readers skip whole months.
+#The file is written under a "_" name, which dataset discovery skips, and only moved into
+#place once complete.
+def write_partition(year_df, station, year, root):
+    directory = partition_directory(root, station, year)
+    os.makedirs(directory, exist_ok=True)
+    part = len([name for name in os.listdir(directory) if name.endswith(".parquet") and not name.startswith("_")])
+    path = os.path.join(directory, f"part-{part}.parquet")
+    temporary = os.path.join(directory, f"_part-{part}.parquet.tmp")
+    writer = None
+    for _, month_df in year_df.groupby(year_df[TIME_COLUMN].dt.month, sort=True):
+        table = pa.Table.from_pandas(month_df, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(temporary, table.schema, write_statistics=True)
+        writer.write_table(table, row_group_size=len(month_df))
+    writer.close()
+    os.replace(temporary, path)
+    return os.path.relpath(path, root)
+
+
+#Appending a frame to the store as new partition files. Rows are assigned to `station`
+#unless the frame has a station column of its own. The manifest is rewritten only after
+#the files are complete, so readers never see a half-written partition.
+def write_store(df, station, root=STORE_PATH, station_column=None):
+    if station_column and station_column in df.columns:
+        groups = [(name, station_df.drop(columns=station_column)) for name, station_df in df.groupby(station_column, sort=True)]
+    else:
+        groups = [(station, df)]
+    entries = read_manifest(root)
+    added = []
+    for name, station_df in groups:
+        table_df = station_df.rename_axis(TIME_COLUMN).reset_index()
+        for year, year_df in table_df.groupby(table_df[TIME_COLUMN].dt.year, sort=True):
+            added.append({
+                "sequence": len(entries) + len(added) + 1,
+                "station": str(name),
+                "file": write_partition(year_df, name, year, root),
+                "start": year_df[TIME_COLUMN].min().isoformat(),
+                "end": year_df[TIME_COLUMN].max().isoformat(),
+                "rows": len(year_df),
+            })
+    write_manifest(entries + added, root)
+    return added
+
+
+#Rows of a single partition file recorded in the manifest
+def read_part(entry, columns=None, root=STORE_PATH):
+    names = [TIME_COLUMN] + list(columns) if columns else None
+    table = pq.read_table(os.path.join(root, entry["file"]), columns=names)
+    return table.to_pandas().set_index(TIME_COLUMN).sort_index()
+
+
+#Reading only the requested columns of one station between start and end (inclusive).
+#The station and year bounds prune partition directories and the timestamp bounds are
+#checked against row-group statistics before any data pages are decoded. A timestamp
+#written by more than one drop is kept once, as Archive.refresh does when ingesting.
+def read_store(columns=None, start=None, end=None, station=None, root=STORE_PATH):
+    dataset = ds.dataset(root, format="parquet", partitioning=PARTITIONING)
+    keys = (TIME_COLUMN, "station", "year")
+    names = [TIME_COLUMN] + list(columns if columns else [name for name in dataset.schema.names if name not in keys])
+    condition = ds.field("station") == str(station if station is not None else stored_stations(root)[0])
+    if start is not None:
+        start = pd.Timestamp(start)
+        condition &= (ds.field("year") >= start.year) & (ds.field(TIME_COLUMN) >= start.to_pydatetime())
+    if end is not None:
+        end = pd.Timestamp(end)
+        condition &= (ds.field("year") <= end.year) & (ds.field(TIME_COLUMN) <= end.to_pydatetime())
+    table = dataset.to_table(columns=names, filter=condition)
+    df = table.to_pandas().set_index(TIME_COLUMN).sort_index(kind="stable")
+    return df[~df.index.duplicated(keep="first")]
+
+
+if __name__ == "__main__":
+    from met.data import DATA_PATH, DEFAULT_STATION, STATION
+
+    source = sys.argv[1] if len(sys.argv) > 1 else DATA_PATH
+    added = write_store(pd.read_parquet(source), DEFAULT_STATION, station_column=STATION)
+    print(f"Wrote {sum(entry['rows'] for entry in added)} rows from {source} to {STORE_PATH} in {len(added)} files")
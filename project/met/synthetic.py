@@ -0,0 +1,103 @@
+#Synthetic MET frames with the same columns as new_df.parquet, for load testing.
+#Write one from the repository root with:
+#    PYTHONPATH=project python -m met.synthetic --years 90 --output project/synthetic.parquet
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from met.data import (AIR_TEMPERATURE, PRECIPITATION, RELATIVE_HUMIDITY, STATION, VARIABLES, WIND_DIRECTION,
+                      WIND_SPEED)
+
+
+GOOD, ACCEPTABLE, SUSPECT, MISSING = "Good", "Acceptable", "Suspect", "Missing"
+
+
+#Slowly varying day-to-day weather: white noise smoothed with an exponential kernel
+def daily_anomaly(rng, days, scale, memory=3.0):
+    kernel = np.exp(-np.arange(int(memory * 5)) / memory)
+    noise = np.convolve(rng.normal(0, 1, days + len(kernel)), kernel / np.sqrt((kernel ** 2).sum()), mode="valid")
+    return scale * noise[:days]
+
+
+#Logger outages: blocks of consecutive samples where every variable is missing
+def outages(rng, size, count, length):
+    missing = np.zeros(size, dtype=bool)
+    for start in rng.integers(0, max(size - length, 1), count):
+        missing[start:start + rng.integers(1, length + 1)] = True
+    return missing
+
+
+#Mostly good flags with some acceptable and a few suspect samples, missing during outages
+def quality_flags(rng, missing, suspect_fraction):
+    flags = np.full(len(missing), GOOD, dtype=object)
+    flags[rng.random(len(missing)) < 0.05] = ACCEPTABLE
+    flags[rng.random(len(missing)) < suspect_fraction] = SUSPECT
+    flags[missing] = MISSING
+    return flags
+
+
+def station_frame(index, rng, outages_per_year=4, outage_length=None, suspect_fraction=0.002):
+    size = len(index)
+    day_number = ((index - index[0].normalize()) // pd.Timedelta(days=1)).to_numpy()
+    days = int(day_number[-1]) + 1 if size else 0
+    season = np.cos(2 * np.pi * (index.dayofyear.to_numpy() - 200) / 365.25)
+    diurnal = np.cos(2 * np.pi * (index.hour.to_numpy() + index.minute.to_numpy() / 60 - 15) / 24)
+    weather = daily_anomaly(rng, days, 2.5)[day_number]
+    storminess = np.exp(daily_anomaly(rng, days, 0.35))[day_number]
+    samples_per_hour = pd.Timedelta(hours=1) / (index[1] - index[0]) if size > 1 else 1
+
+    temperature = 10.5 + 6.0 * season + 3.0 * diurnal + weather + rng.normal(0, 0.4, size)
+    humidity = np.clip(86 - 6 * season - 10 * diurnal - 2 * weather + rng.normal(0, 3, size), 30, 100)
+    speed = rng.gamma(2.2, 5.5 * (1 - 0.2 * season) * storminess, size)
+    direction = np.mod(np.degrees(rng.vonmises(np.radians(225), 1.2, size)), 360)
+    wet_day = rng.random(days) < 0.45 - 0.1 * np.cos(2 * np.pi * (np.arange(days) - 15) / 365.25)
+    raining = wet_day[day_number] & (rng.random(size) < 0.3)
+    precipitation = np.where(raining, np.round(rng.exponential(1.2 / samples_per_hour, size) / 0.2) * 0.2, 0.0)
+
+    columns = {
+        PRECIPITATION: precipitation,
+        AIR_TEMPERATURE: temperature,
+        RELATIVE_HUMIDITY: humidity,
+        WIND_SPEED: speed,
+        WIND_DIRECTION: direction,
+    }
+    years = max(size / (365.25 * 24 * samples_per_hour), 1)
+    outage_length = outage_length or max(1, int(6 * samples_per_hour))
+    missing = outages(rng, size, int(outages_per_year * years), outage_length)
+    df = pd.DataFrame(index=index)
+    for variable in VARIABLES:
+        df[variable] = np.where(missing, np.nan, columns[variable])
+    for variable in VARIABLES:
+        df[f"{variable} Quality"] = quality_flags(rng, missing, suspect_fraction)
+    return df
+
+
+#Schema-identical frame for any span, sampling interval and number of stations.
+#With more than one station a Station column is added and rows are ordered by
+#station, then time.
+def generate(years=9, start_year=2014, freq="15min", stations=1, seed=0, **options):
+    index = pd.date_range(f"{start_year}-01-01", f"{start_year + years - 1}-12-31 23:59:59", freq=freq)
+    rng = np.random.default_rng(seed)
+    if stations == 1:
+        return station_frame(index, rng, **options)
+    frames = []
+    for number in range(1, stations + 1):
+        frame = station_frame(index, np.random.default_rng(rng.integers(2 ** 32)), **options)
+        frame.insert(0, STATION, f"Station {number}")
+        frames.append(frame)
+    return pd.concat(frames)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic NWFP MET parquet file.")
+    parser.add_argument("--years", type=int, default=9)
+    parser.add_argument("--start-year", type=int, default=2014)
+    parser.add_argument("--freq", default="15min")
+    parser.add_argument("--stations", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+    df = generate(args.years, args.start_year, args.freq, args.stations, args.seed)
+    df.to_parquet(args.output)
+    print(f"Wrote {len(df)} rows to {args.output}")
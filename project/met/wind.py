@@ -0,0 +1,125 @@
+#Wind rose frequencies by direction sector and speed class
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from met.data import WIND_DIRECTION, WIND_SPEED
+from met.profiling import timed
+from met.quality import masked_values
+
+
+SECTOR_NAMES = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE", "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+
+#Lower edges of the wind speed classes in km/h; the last class is open-ended
+SPEED_EDGES = (0, 5, 10, 20, 30, 40)
+
+
+#Columns carrying the summed wind vector through the aggregation cube
+WIND_U = "Wind U (km/h)"
+WIND_V = "Wind V (km/h)"
+RESULTANT_WIND_SPEED = "Resultant Wind Speed (km/h)"
+
+
+#East (u) and north (v) components of the wind vector, NaN where either input is missing.
+#Directions are where the wind blows from, so the mean direction is atan2(u, v).
+def wind_components(direction, speed):
+    radians = np.deg2rad(direction)
+    return speed * np.sin(radians), speed * np.cos(radians)
+
+
+#Vector-mean direction and resultant speed from summed components and sample counts.
+#Averaging the components keeps 350° and 10° together at 0° instead of 180°.
+def vector_mean(u_sum, v_sum, count):
+    count = np.where(np.asarray(count) > 0, count, np.nan)
+    u_mean, v_mean = np.asarray(u_sum) / count, np.asarray(v_sum) / count
+    speed = np.hypot(u_mean, v_mean)
+    direction = np.where(speed > 0, np.mod(np.degrees(np.arctan2(u_mean, v_mean)), 360.0), np.nan)
+    return direction, speed
+
+
+def speed_labels(edges=SPEED_EDGES):
+    labels = [f"{low}-{high} km/h" for low, high in zip(edges[:-1], edges[1:])]
+    return labels + [f"{edges[-1]}+ km/h"]
+
+
+#Percentage of valid samples in each direction sector x speed class, from a single
+#bincount over the combined (sector, class) codes. Sectors are centred on their
+#compass direction, so N covers the half sector either side of 0°.
+def rose_counts(direction, speed, sectors=len(SECTOR_NAMES), edges=SPEED_EDGES):
+    direction = np.asarray(direction, dtype=np.float64)
+    speed = np.asarray(speed, dtype=np.float64)
+    valid = np.isfinite(direction) & np.isfinite(speed)
+    width = 360.0 / sectors
+    sector = (np.mod(direction[valid] + width / 2, 360.0) // width).astype(np.int64) % sectors
+    speed_class = np.clip(np.searchsorted(edges, speed[valid], side="right") - 1, 0, len(edges) - 1)
+    counts = np.bincount(sector * len(edges) + speed_class, minlength=sectors * len(edges))
+    frequencies = counts.reshape(sectors, len(edges)) * (100.0 / max(valid.sum(), 1))
+    return pd.DataFrame(frequencies, index=list(SECTOR_NAMES[:sectors]), columns=speed_labels(edges))
+
+
+#Rose of the full record, a year, a month or a day of a station; each window is computed
+#once per process and archive version, and kept in the persistent cache. The archive
+#import is deferred because the aggregation cube it builds depends on this module.
+@st.cache_data(show_spinner=False)
+def load_rose(year=None, month=None, day=None, station=None, version=0):
+    from met.archive import load_archive
+
+    archive = load_archive(station)
+
+    @timed("wind rose", year=year, month=month, day=day, station=station)
+    def build():
+        df = archive.frame
+        if year is not None:
+            df = archive.partitions.slice(df, year, month, day)
+        values = masked_values(df, [WIND_DIRECTION, WIND_SPEED])
+        return rose_counts(values[WIND_DIRECTION].to_numpy(), values[WIND_SPEED].to_numpy())
+    return archive.cache.frame(f"rose-{year}-{month}-{day}", build)
+
+
+#Stacked barpolar chart with one trace per speed class
+def rose_figure(rose, height=450):
+    import plotly.express as px
+
+    colors = px.colors.sequential.Blues[-len(rose.columns):]
+    fig = go.Figure()
+    for label, color in zip(rose.columns, colors):
+        fig.add_trace(go.Barpolar(r=rose[label], theta=rose.index, name=label, marker_color=color))
+    fig.update_layout(
+        height=height,
+        margin=dict(t=20, b=20, l=20, r=20),
+        legend=dict(title="Wind Speed"),
+        polar=dict(
+            barmode="stack",
+            angularaxis=dict(direction="clockwise", rotation=90),
+            radialaxis=dict(ticksuffix="%", angle=45)))
+    return fig
+
+
+#Vector-mean direction of each period against its mean speed, one marker per period
+def direction_figure(data, height=450):
+    speed = data[WIND_SPEED]
+    fig = go.Figure(
+        data=go.Scatterpolar(
+            r=speed,
+            theta=data[WIND_DIRECTION],
+            mode="markers",
+            marker=dict(
+                color=speed,
+                colorscale="ice_r",
+                line=dict(width=1, color="black"),
+                size=15,
+                colorbar=dict(title="Wind Speed", x=1, y=0.5, len=1.5)),
+            opacity=0.70))
+    fig.update_layout(
+        width=height,
+        height=height,
+        margin=dict(t=0, b=0, l=0, r=0),
+        polar=dict(
+            angularaxis=dict(
+                direction="clockwise",
+                tickvals=[0, 45, 90, 135, 180, 225, 270, 315],
+                ticktext=["N", "NE", "E", "SE", "S", "SW", "W", "NW"],
+                tickmode="array"),
+            radialaxis=dict(visible=True, ticks="outside")))
+    return fig
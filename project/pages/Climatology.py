@@ -0,0 +1,81 @@
+import plotly.graph_objects as go
+import streamlit as st
+from met.archive import current_archive
+from met.climatology import NORMAL_VARIABLES, anomalies, load_climatology, reference_dates
+from met.data import select_station
+from met.page import SIDEBAR_STYLE
+from met.partition import MONTH_NUMBERS
+from met.profiling import plotly_chart, profile_panel
+
+
+st.set_page_config(layout="wide")
+st.title("Climatology and Anomalies")
+st.markdown(SIDEBAR_STYLE, unsafe_allow_html=True)
+
+
+
+
+#Normals of the whole record, computed once per station and archive version
+station = select_station()
+archive = current_archive(station)
+climate = load_climatology(station, archive.version)
+partitions = archive.partitions
+col1, col2, col3, col4 = st.columns(4)
+selected_variable = col1.selectbox("Select variable:", NORMAL_VARIABLES, key="variable")
+selected_year = col2.selectbox("Select Year: (Optional)", [None] + partitions.years(), key="year")
+months = partitions.month_names(selected_year) if selected_year else []
+selected_month = col3.selectbox("Select Month: (Optional)", [None] + months, key="month", disabled=not months)
+days = partitions.days(selected_year, MONTH_NUMBERS[selected_month]) if selected_month in months else []
+selected_day = col4.selectbox("Select Day: (Optional)", [None] + days, key="day", disabled=not days)
+
+
+#Normal band (10th-90th and 25th-75th percentiles) and mean, with the observed values on top
+def normals_figure(frame, observed=None):
+    fig = go.Figure()
+    for low, high, alpha in (("p10", "p90", 0.15), ("p25", "p75", 0.3)):
+        fig.add_trace(go.Scatter(x=frame.index, y=frame[high], mode='lines', line=dict(width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=frame.index, y=frame[low], mode='lines', line=dict(width=0), fill='tonexty',
+                                 fillcolor=f'rgba(100, 149, 237, {alpha})', name=f'{low[1:]}th-{high[1:]}th percentile'))
+    fig.add_trace(go.Scatter(x=frame.index, y=frame['mean'], mode='lines', name='Normal',
+                             line=dict(color='CornflowerBlue', dash='dash')))
+    if observed is not None:
+        fig.add_trace(go.Scatter(x=frame.index, y=observed, mode='lines', name='Observed', line=dict(color='Coral')))
+    fig.update_layout(
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=350,
+        legend=dict(orientation='h', yanchor='bottom', y=-0.3, xanchor='center', x=0.5))
+    return fig
+
+
+def anomaly_figure(frame):
+    colors = ['Coral' if value > 0 else 'CornflowerBlue' for value in frame['anomaly'].fillna(0)]
+    fig = go.Figure(go.Bar(x=frame.index, y=frame['anomaly'], marker_color=colors))
+    fig.update_layout(margin=dict(t=0, b=0, l=0, r=0), height=250, yaxis_title='Departure from normal')
+    return fig
+
+
+if not selected_year:
+    st.subheader(f"Daily Normals of {selected_variable}")
+    day_normals = climate["normals-day"][selected_variable]
+    plotly_chart(normals_figure(day_normals.set_axis(reference_dates(day_normals.index))), key="normals")
+    st.caption("x-axis shows calendar days; the year is not meaningful")
+else:
+    if selected_day:
+        rule, period, when = "h", (selected_year, MONTH_NUMBERS[selected_month], selected_day), f"on {selected_day} {selected_month} {selected_year}"
+    elif selected_month:
+        rule, period, when = "D", (selected_year, MONTH_NUMBERS[selected_month]), f"in {selected_month} {selected_year}"
+    else:
+        rule, period, when = "D", (selected_year,), f"in {selected_year}"
+    frame = anomalies(archive.cube.period(rule, *period)[selected_variable], climate, rule)
+    label = "Hourly" if rule == "h" else "Daily"
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Mean departure from normal:", f"{frame['anomaly'].mean():+.2f}")
+    col2.metric(f"{label} values above the 90th percentile:", f"{int((frame['value'] > frame['p90']).sum())}")
+    col3.metric(f"{label} values below the 10th percentile:", f"{int((frame['value'] < frame['p10']).sum())}")
+    st.subheader(f"{label} {selected_variable} against the normal {when}")
+    plotly_chart(normals_figure(frame, frame['value']), key="observed")
+    st.subheader(f"Anomalies {when}")
+    plotly_chart(anomaly_figure(frame), key="anomalies")
+
+
+profile_panel()
@@ -0,0 +1,68 @@
+import streamlit as st
+from met.archive import current_archive
+from met.correlation import (CORRELATION_VARIABLES, DEFAULT_GRIDSIZE, correlation_figure, heatmap_figure, hexbin_figure,
+                             load_correlation, load_density)
+from met.data import AIR_TEMPERATURE, RELATIVE_HUMIDITY, select_station
+from met.page import SIDEBAR_STYLE
+from met.partition import MONTH_NUMBERS
+from met.profiling import plotly_chart, profile_panel
+
+
+st.set_page_config(layout="wide")
+st.title("Correlation Between Variables")
+st.markdown(SIDEBAR_STYLE, unsafe_allow_html=True)
+
+
+
+
+#Correlations and densities are computed on the server per period and cached
+station = select_station()
+archive = current_archive(station)
+partitions = archive.partitions
+col1, col2, col3 = st.columns(3)
+selected_year = col1.selectbox("Select Year: (Optional)", [None] + partitions.years(), key="year")
+months = partitions.month_names(selected_year) if selected_year else []
+selected_month = col2.selectbox("Select Month: (Optional)", [None] + months, key="month", disabled=not months)
+days = partitions.days(selected_year, MONTH_NUMBERS[selected_month]) if selected_month in months else []
+selected_day = col3.selectbox("Select Day: (Optional)", [None] + days, key="day", disabled=not days)
+period = dict(
+    year=selected_year,
+    month=MONTH_NUMBERS[selected_month] if selected_month in months else None,
+    day=selected_day if selected_day in days else None,
+)
+if selected_day in days:
+    when = f"on {selected_day} {selected_month} {selected_year}"
+elif selected_month in months:
+    when = f"in {selected_month} {selected_year}"
+elif selected_year:
+    when = f"in {selected_year}"
+else:
+    when = "over the whole record"
+
+
+
+
+matrix, counts = load_correlation(**period, station=station, version=archive.version)
+st.header(f"Correlation Matrix {when}")
+plotly_chart(correlation_figure(matrix), key="matrix")
+
+
+
+
+st.header("Scatter Density")
+col1, col2, col3, col4 = st.columns(4)
+x_variable = col1.selectbox("Select x variable:", CORRELATION_VARIABLES, index=CORRELATION_VARIABLES.index(AIR_TEMPERATURE), key="x")
+y_variable = col2.selectbox("Select y variable:", CORRELATION_VARIABLES, index=CORRELATION_VARIABLES.index(RELATIVE_HUMIDITY), key="y")
+kind = col3.radio("Select density grid:", ["Hexbin", "Heatmap"], horizontal=True, key="kind")
+gridsize = col4.select_slider("Select cells across:", options=[20, 30, 40, 60, 80], value=DEFAULT_GRIDSIZE, key="gridsize")
+col1, col2 = st.columns(2)
+col1.metric("Pearson correlation:", f"{matrix.loc[x_variable, y_variable]:.2f}")
+col2.metric("Samples with both values:", f"{counts.loc[x_variable, y_variable]:,}")
+density = load_density(x_variable, y_variable, kind.lower(), gridsize, **period, station=station, version=archive.version)
+if kind == "Hexbin":
+    plotly_chart(hexbin_figure(*density, x_variable, y_variable), key="density")
+else:
+    plotly_chart(heatmap_figure(density, x_variable, y_variable), key="density")
+
+
+profile_panel()
@@ -0,0 +1,71 @@
+import datetime
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from met.aggregates import SUM_VARIABLES, coverage_column
+from met.archive import current_archive
+from met.data import VARIABLES, select_station
+from met.downsample import DEFAULT_POINTS, downsample
+from met.page import SIDEBAR_STYLE
+from met.profiling import plotly_chart, profile_panel
+from met.ranges import FREQUENCIES, load_prefix_index, max_column, min_column
+
+
+st.set_page_config(layout="wide")
+st.title("Date Range Explorer")
+st.markdown(SIDEBAR_STYLE, unsafe_allow_html=True)
+
+
+
+
+#Every window is answered from prefix sums and sparse tables over the hourly state
+station = select_station()
+archive = current_archive(station)
+index = load_prefix_index(station, archive.version)
+first_day, last_day = index.start.date(), index.end.date()
+col1, col2, col3 = st.columns([2, 1, 2])
+selected_range = col1.date_input("Select date range:", value=(max(first_day, last_day - datetime.timedelta(days=365)), last_day),
+                                 min_value=first_day, max_value=last_day, key="range")
+resolution = col2.selectbox("Select resolution:", list(FREQUENCIES), index=1, key="resolution")
+selected_variable = col3.selectbox("Select variable:", VARIABLES, key="variable")
+kind = "Total" if selected_variable in SUM_VARIABLES else "Average"
+
+
+
+
+if len(selected_range) < 2:
+    st.info("Select the last day of the range.")
+else:
+    start = pd.Timestamp(selected_range[0])
+    end = pd.Timestamp(selected_range[1]) + pd.Timedelta(hours=23)
+    total = index.total(start, end)
+    st.header(f"Summary Statistics ({selected_range[0]:%d %B %Y} - {selected_range[1]:%d %B %Y})")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(f"{kind}:", f"{total[selected_variable]:.2f}")
+    if max_column(selected_variable) in total.index:
+        col2.metric("Maximum:", f"{total[max_column(selected_variable)]:.2f}")
+        col3.metric("Minimum:", f"{total[min_column(selected_variable)]:.2f}")
+    col4.metric("Coverage:", f"{total[coverage_column(selected_variable)]:.0%}")
+
+    window = index.window(start, end, FREQUENCIES[resolution])
+    st.subheader(f"{resolution} {kind}s")
+    series = downsample(window[selected_variable], mode="minmax" if selected_variable in SUM_VARIABLES else "lttb")
+    fig = go.Figure()
+    #The range of each bucket is drawn as a band when every bucket fits on the chart
+    if max_column(selected_variable) in window.columns and len(window) <= DEFAULT_POINTS:
+        fig.add_trace(go.Scatter(x=window.index, y=window[max_column(selected_variable)], mode='lines',
+                                 line=dict(width=0), name='Maximum', showlegend=False))
+        fig.add_trace(go.Scatter(x=window.index, y=window[min_column(selected_variable)], mode='lines',
+                                 line=dict(width=0), fill='tonexty', fillcolor='rgba(100, 149, 237, 0.25)',
+                                 name='Range'))
+    fig.add_trace(go.Scatter(x=series.index, y=series, mode='lines', name=kind, line=dict(color='CornflowerBlue')))
+    fig.update_layout(
+        margin=dict(t=0, b=0, l=0, r=0),
+        yaxis_title=selected_variable,
+        height=350,
+        legend=dict(orientation='h', yanchor='bottom', y=-0.3, xanchor='center', x=0.5))
+    plotly_chart(fig, key="range-chart")
+
+
+profile_panel()
@@ -0,0 +1,65 @@
+import plotly.graph_objects as go
+import streamlit as st
+from met.data import VARIABLES, WIND_DIRECTION
+from met.live import LIVE_FEED_PATH, load_monitor
+from met.page import SIDEBAR_STYLE
+from met.profiling import plotly_chart, profile_panel
+
+
+st.set_page_config(layout="wide")
+st.title("Live Conditions")
+st.markdown(SIDEBAR_STYLE, unsafe_allow_html=True)
+
+
+
+
+#One shared tail of the logger feed; the archive is never loaded on this page
+monitor = load_monitor()
+refresh_seconds = st.sidebar.select_slider("Refresh every (seconds):", options=[5, 10, 30, 60], value=10)
+selected_variable = st.sidebar.radio("Select variable to follow:", options=[v for v in VARIABLES if v != WIND_DIRECTION])
+monitor.poll()
+if not monitor.buffer.size:
+    st.info(f"Waiting for readings in {LIVE_FEED_PATH}. Start the simulated feed with `PYTHONPATH=project python -m met.live --simulate`.")
+
+
+
+
+#Only these fragments rerun on the timer; the rest of the page stays as it is
+@st.fragment(run_every=refresh_seconds)
+def current_conditions():
+    monitor.poll()
+    recent = monitor.recent()
+    if recent.empty:
+        return
+    latest = recent.iloc[-1]
+    means = monitor.rolling_means()
+    st.header(f"Latest Readings ({recent.index[-1]:%d %B %Y %H:%M})")
+    columns = st.columns(len(VARIABLES))
+    for column, variable in zip(columns, VARIABLES):
+        delta = latest[variable] - means[variable]
+        #Directions differ the short way round the circle
+        if variable == WIND_DIRECTION:
+            delta = (delta + 180) % 360 - 180
+        column.metric(f"{variable}:", f"{latest[variable]:.2f}", f"{delta:+.2f} vs window mean", delta_color="off")
+
+
+@st.fragment(run_every=refresh_seconds)
+def recent_trend(variable):
+    recent = monitor.recent()
+    if recent.empty:
+        return
+    st.subheader(f"{variable} over the last {recent.index[-1] - recent.index[0]}")
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=recent.index, y=recent[variable],
+                             mode='lines', name=variable, line=dict(color='CornflowerBlue')))
+    fig.update_layout(
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=300)
+    plotly_chart(fig, key="live")
+
+
+current_conditions()
+recent_trend(selected_variable)
+
+
+profile_panel()